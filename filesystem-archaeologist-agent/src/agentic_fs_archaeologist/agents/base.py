@@ -69,6 +69,7 @@ class BaseAgent(ABC):
         messages: list,
         response_format: Optional[Any] = None,
         temperature: Optional[float] = None,
+        prompt_cache_key: Optional[str] = None,
     ) -> Any:
         """
         Helper function used to make a call to the LLM.
@@ -77,6 +78,8 @@ class BaseAgent(ABC):
             messages: List of message dicts with role and content
             response_format: Optional Pydantic model for structured output
             temperature: Optional temperature override
+            prompt_cache_key: Optional key used by the provider to route
+                requests sharing a prompt prefix, improving cache hits
 
         Returns:
             LLM response (parsed if response_format provided)
@@ -90,12 +93,16 @@ class BaseAgent(ABC):
                 logger.error(error_message)
                 raise AgentError(error_message)
 
+            # Passed as extra body, as older clients lack the parameter
+            extra_body = {"prompt_cache_key": prompt_cache_key} \
+                if prompt_cache_key else None
             if response_format:
                 response = await self.client.chat.completions.parse(
                     model=self.model,
                     messages=messages,
                     response_format=response_format,
                     temperature=temperature or self.temperature,
+                    extra_body=extra_body,
                 )
                 return response.choices[0].message.parsed
             else:
@@ -103,6 +110,7 @@ class BaseAgent(ABC):
                     model=self.model,
                     messages=messages,
                     temperature=temperature or self.temperature,
+                    extra_body=extra_body,
                 )
                 return response.choices[0].message.content
         except Exception as e:
@@ -1,3 +1,5 @@
+import os
+import re
 import subprocess
 import time
 
@@ -19,7 +21,10 @@ from agentic_fs_archaeologist.models import (
     ReActHistory,
 )
 from agentic_fs_archaeologist.prompts.prompts import load_prompts
-from agentic_fs_archaeologist.tools import FileSystemTools
+from agentic_fs_archaeologist.tools import (
+    FileSystemTools,
+    run_sync_batched,
+)
 from agentic_fs_archaeologist.utils.file_utils import format_file_size
 
 
@@ -47,6 +52,22 @@ class ClassifierAgent(ReActAgent):
     Uses language model as both orchestrator AND decision-maker.
     """
 
+    # Case-insensitive patterns used to parse the LLM classification
+    # response, in order of precedence (first match wins)
+    _RECOMMENDATION_RES = [
+        (rec.lower(), re.compile(f"recommendation: {rec}", re.IGNORECASE))
+        for rec in ("DELETE", "REVIEW", "KEEP")
+    ]
+    _CATEGORY_RES = [
+        (cat, re.compile(cat, re.IGNORECASE))
+        for cat in ("SAFE", "LIKELY_SAFE", "UNCERTAIN", "UNSAFE")
+    ]
+    _CONFIDENCE_RES = [
+        (conf, re.compile(conf, re.IGNORECASE))
+        for conf in ("HIGH", "MEDIUM", "LOW")
+    ]
+    _REASONING_RE = re.compile("reasoning:", re.IGNORECASE)
+
     def __init__(self, memory: MemoryRetrieval):
         super().__init__()
         self.memory = memory
@@ -54,6 +75,16 @@ class ClassifierAgent(ReActAgent):
         self.session_cache = {}
         self.cache_ttl = settings.classifier_cache_ttl
         self.classifications = []  # Store intermediate results
+        # The tools are static, so build the tool dict once
+        self._tools_cache: Dict[str, Callable] = {
+            "get_items_to_classify": self._get_items_to_classify,
+            "classify_item_using_llm": self._classify_item_using_llm,
+            "classify_item_fallback": self._classify_item_fallback,
+            "check_git_status": self._check_git_status,
+            "query_similar_decisions": self._query_similar_decisions,
+            "check_dependencies": self._check_dependencies,
+            "finish": self._finish,
+        }
 
     def _build_react_prompt(
             self,
@@ -107,15 +138,20 @@ class ClassifierAgent(ReActAgent):
 
         try:
             # Check 1: Is this a symlink target? (other files depend on it)
+            # (the directory is listed off the event loop, in batches)
             if target.exists():
                 parent_dir = target.parent
-                for item in parent_dir.iterdir():
-                    try:
-                        if item.is_symlink() and item.resolve() == target:
-                            has_dependencies = True
-                            dependencies.append(f"Symlink: {item}")
-                    except (OSError, RuntimeError):
-                        continue
+                with os.scandir(parent_dir) as entries:
+                    async for batch in run_sync_batched(entries):
+                        for entry in batch:
+                            try:
+                                item = Path(entry.path)
+                                if entry.is_symlink() and \
+                                        item.resolve() == target:
+                                    has_dependencies = True
+                                    dependencies.append(f"Symlink: {item}")
+                            except (OSError, RuntimeError):
+                                continue
 
             # Check 2: Is path currently in use?
             # (do a basic check via lsof, if available)
@@ -315,7 +351,7 @@ class ClassifierAgent(ReActAgent):
 
             # Get memory context
             memory_context = ""
-            similar = await self.memory.find_similar(Path(path))
+            similar = self.memory.find_similar(Path(path))
             if similar:
                 avg_approval = (
                     sum(e.approval_rate for e in similar) / len(similar)
@@ -368,25 +404,22 @@ class ClassifierAgent(ReActAgent):
 
             # Extract recommendation
             recommendation = "KEEP"
-            recommendations = ["DELETE", "REVIEW", "KEEP"]
-            for rec in recommendations:
-                if f"Recommendation: {rec}" in content or \
-                   f"recommendation: {rec.lower()}" in content.lower():
-                    recommendation = rec.lower()
+            for rec, pattern in self._RECOMMENDATION_RES:
+                if pattern.search(content):
+                    recommendation = rec
                     break
 
             # Extract category
             category = "UNCERTAIN"
-            categories = ["SAFE", "LIKELY_SAFE", "UNCERTAIN", "UNSAFE"]
-            for cat in categories:
-                if cat in content.upper():
+            for cat, pattern in self._CATEGORY_RES:
+                if pattern.search(content):
                     category = cat
                     break
 
             # Extract confidence
             confidence = "MEDIUM"
-            for conf in ["HIGH", "MEDIUM", "LOW"]:
-                if conf in content.upper():
+            for conf, pattern in self._CONFIDENCE_RES:
+                if pattern.search(content):
                     confidence = conf
                     break
 
@@ -394,9 +427,8 @@ class ClassifierAgent(ReActAgent):
             reasoning = content
             if "Reasoning:" in content:
                 reasoning = content.split("Reasoning:", 1)[1].strip()
-            elif "reasoning:" in content.lower():
-                idx = content.lower().find("reasoning:")
-                reasoning = content[idx + 10:].strip()
+            elif match := self._REASONING_RE.search(content):
+                reasoning = content[match.end():].strip()
 
             classification_dict = {
                 "path": path,
@@ -535,7 +567,7 @@ class ClassifierAgent(ReActAgent):
         """
         Helper function used to query memory for similar past decisions.
         """
-        similar = await self.memory.find_similar(Path(path))
+        similar = self.memory.find_similar(Path(path))
 
         return {
             "similar_count": len(similar),
@@ -558,12 +590,4 @@ class ClassifierAgent(ReActAgent):
         """
         Helper function to get the tools. Note that the sequence matters.
         """
-        return {
-            "get_items_to_classify": self._get_items_to_classify,
-            "classify_item_using_llm": self._classify_item_using_llm,
-            "classify_item_fallback": self._classify_item_fallback,
-            "check_git_status": self._check_git_status,
-            "query_similar_decisions": self._query_similar_decisions,
-            "check_dependencies": self._check_dependencies,
-            "finish": self._finish,
-        }
+        return self._tools_cache
@@ -1,8 +1,19 @@
+import asyncio
+import hashlib
+import io
 import json
 import re
+import time
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.agents.base import ToolBasedAgent
@@ -41,6 +52,26 @@ class ReActAgent(ToolBasedAgent):
         - _compile_results(): Convert history to final result
     """
 
+    # Speculation is switched off after this many consecutive misses
+    MAX_SPECULATION_MISSES = 3
+
+    # Number of recent thoughts/observations used to key the thought cache
+    THOUGHT_CACHE_TAIL = 3
+    THOUGHT_CACHE_MAX_ENTRIES = 512
+    # Whether the actions of an action sequence are independent of each
+    # other and can be executed concurrently
+    PARALLEL_ACTIONS = False
+
+    def __init__(self, model: Optional[str] = None):
+        super().__init__(model=model)
+        self.speculative_thoughts = self.settings.speculative_thoughts
+        self._speculation_hits = 0
+        self._speculation_misses = 0
+        # LRU cache of thoughts keyed on context and recent history
+        self._thought_cache: OrderedDict[bytes, Dict[str, Any]] = \
+            OrderedDict()
+        self.thought_cache_ttl = self.settings.thought_cache_ttl
+
     def _build_react_prompt(
         self,
         state: AgentState,
@@ -150,16 +181,26 @@ INVALID (will cause errors):
             InvalidActionError: If agent tries to use invalid tool
         """
         history = ReActHistory()
+        # Results of previously executed (action, action_input) pairs, used
+        # to predict observations when speculating on the next thought
+        last_results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        next_thought: Optional[ReActThought] = None
+        spec_task: Optional[asyncio.Task] = None
 
         try:
             m = self.max_iterations
             for iteration in range(self.max_iterations):
-                logger.debug(f"Working on iteration #{iteration + 1} of {m}")
+                logger.debug("Working on iteration #%d of %d",
+                             iteration + 1, m)
 
                 # 1. REASON - Get next thought from LLM
-                thought = await self._get_thought(
-                    state=state,
-                    history=history)
+                # (unless a speculative thought was confirmed last iteration)
+                if next_thought is not None:
+                    thought, next_thought = next_thought, None
+                else:
+                    thought = await self._get_thought(
+                        state=state,
+                        history=history)
 
                 # Clean up action name - remove trailing parentheses if present
                 if thought.action and thought.action.endswith("()"):
@@ -178,11 +219,7 @@ INVALID (will cause errors):
 
                     if thought.action and thought.action != "null":
                         # Execute final action (e.g., finish) before breaking
-                        if thought.action not in self._get_tools():
-                            raise InvalidActionError(
-                                thought.action,
-                                list(self._get_tools().keys())
-                            )
+                        self._validate_action(thought.action)
                         observation = await self._execute_action(thought)
                         history.observations.append(observation)
                     history.final_answer = thought.thought
@@ -192,6 +229,22 @@ INVALID (will cause errors):
                     history.final_answer = thought.thought
                     break
 
+                # Speculatively request the next thought while the actions
+                # run, assuming they return what they returned last time
+                action_keys = self._get_action_keys(thought)
+                predicted = self._predict_observations(
+                    action_keys=action_keys,
+                    last_results=last_results)
+                if predicted is not None:
+                    spec_history = ReActHistory(
+                        thoughts=list(history.thoughts),
+                        observations=history.observations + predicted)
+                    spec_task = asyncio.create_task(
+                        self._get_thought(state=state, history=spec_history))
+                    # Yield once so the LLM request is dispatched
+                    await asyncio.sleep(0)
+                n_observations = len(history.observations)
+
                 # Batch Action Sequences optimisation
                 # Executes multiple related tools per reasoning step instead
                 # of one tool call per iteration. This will help to improve
@@ -199,58 +252,34 @@ INVALID (will cause errors):
                 # operations
 
                 # 3. ACT - Execute actions (single or batch)
-                if thought.actions:
-                    # Execute action sequence
+                if thought.actions and self.PARALLEL_ACTIONS:
+                    # Execute independent actions concurrently; observations
+                    # are kept in the order the actions were listed
                     for action_spec in thought.actions:
-                        action_name = action_spec.get("action")
-                        action_input_json =\
-                            action_spec.get("action_input", "{}")
-
-                        if action_name is None \
-                                or action_name not in self._get_tools():
-                            available_actions = list(self._get_tools().keys())
-                            raise InvalidActionError(
-                                action=action_name,
-                                available_actions=available_actions)
-
-                        # Create temporary thought for this action
-                        temp_thought = ReActThought(
-                            thought=f"Executing {action_name} from batch",
-                            action=action_name,
-                            action_input=action_input_json,
-                            should_continue=True
-                        )
+                        self._validate_action(action_spec.get("action"))
+                    observations = await asyncio.gather(*(
+                        self._execute_batch_action(action_spec=action_spec)
+                        for action_spec in thought.actions))
+                    history.observations.extend(observations)
 
-                        try:
-                            observation = await self._execute_action(
-                                thought=temp_thought)
-                            history.observations.append(observation)
-                        except Exception as e:
-                            error_observation = ReActObservation(
-                                action=action_name,
-                                result={
-                                    "error":
-                                    f"Batch action failed: {str(e)}"
-                                },
-                                timestamp=datetime.now()
-                            )
-                            history.observations.append(error_observation)
-                            w = f"Batch action '{action_name}' failed: {e}"
-                            logger.warning(w)
+                elif thought.actions:
+                    # Execute action sequence
+                    for action_spec in thought.actions:
+                        self._validate_action(action_spec.get("action"))
+                        observation = await self._execute_batch_action(
+                            action_spec=action_spec)
+                        history.observations.append(observation)
 
                 elif thought.action and thought.action != "null":
                     # Legacy single action execution
-                    if thought.action not in self._get_tools():
-                        raise InvalidActionError(
-                            thought.action,
-                            list(self._get_tools().keys())
-                        )
+                    self._validate_action(thought.action)
 
                     try:
                         observation = await self._execute_action(thought)
                         history.observations.append(observation)
                     except Exception as e:
                         # Add error observation so ReAct can learn and adapt
+                        # (the next iteration can try a different approach)
                         error_observation = ReActObservation(
                             action=thought.action,
                             result={
@@ -260,9 +289,17 @@ INVALID (will cause errors):
                         )
                         history.observations.append(error_observation)
                         logger.warning(f"Tool '{thought.action}' failed: {e}")
-                        # Continue to next iteration
-                        # (so agent can try different approach)
-                        continue
+
+                actual = history.observations[n_observations:]
+                for key, observation in zip(action_keys, actual):
+                    last_results[key] = observation.result
+
+                if spec_task is not None:
+                    next_thought = await self._resolve_speculation(
+                        spec_task=spec_task,
+                        predicted=predicted,
+                        actual=actual)
+                    spec_task = None
 
             else:
                 # Loop completed without finishing - compile partial results
@@ -282,6 +319,9 @@ INVALID (will cause errors):
                 reasoning=self._extract_reasoning(history),
                 error=str(e)
             )
+        finally:
+            if spec_task is not None:
+                spec_task.cancel()
 
     async def _execute_action(
         self,
@@ -306,20 +346,18 @@ INVALID (will cause errors):
         action_input = {}
         if thought.action_input:
             # Log raw action_input for debugging
-            logger.debug(
-                "Raw action_input from LLM: "
-                f"{repr(thought.action_input)}"
-            )
+            logger.debug("Raw action_input from LLM: %r",
+                         thought.action_input)
 
             # First, try parsing without any sanitization
             try:
                 action_input = json.loads(thought.action_input)
-                logger.debug("Successfully parsed action_input: "
-                             f"{action_input}")
+                logger.debug("Successfully parsed action_input: %s",
+                             action_input)
             except json.JSONDecodeError as e:
                 # Only sanitize if initial parsing fails
-                logger.debug(f"Initial parse failed: {e}. "
-                             "Attempting sanitization...")
+                logger.debug("Initial parse failed: %s. "
+                             "Attempting sanitization...", e)
 
                 sanitized_input = thought.action_input.strip()
 
@@ -335,15 +373,12 @@ INVALID (will cause errors):
                 # Replace single quotes with double quotes to make valid JSON
                 sanitized_input = sanitized_input.replace("'", '"')
 
-                logger.debug(
-                    "Sanitized action_input: "
-                    f"{repr(sanitized_input)}"
-                )
+                logger.debug("Sanitized action_input: %r", sanitized_input)
 
                 try:
                     action_input = json.loads(sanitized_input)
-                    logger.debug("Successfully parsed after sanitization: "
-                                 f"{action_input}")
+                    logger.debug("Successfully parsed after sanitization: %s",
+                                 action_input)
                 except json.JSONDecodeError as e2:
                     logger.warning(
                         f"Failed to parse action_input after sanitization. "
@@ -391,10 +426,8 @@ INVALID (will cause errors):
 
         # Executing a tool
         tool_to_execute = thought.action
-        logger.debug(
-            f"Executing tool '{tool_to_execute}' "
-            f"with inputs: {action_input}"
-        )
+        logger.debug("Executing tool '%s' with inputs: %s",
+                     tool_to_execute, action_input)
 
         # Handle case where action_input is a list instead of dict
         if isinstance(action_input, list):
@@ -416,6 +449,42 @@ INVALID (will cause errors):
             timestamp=datetime.now()
         )
 
+    async def _execute_batch_action(
+        self,
+        action_spec: Dict[str, Any]
+    ) -> ReActObservation:
+        """
+        Helper function used to execute one action of an action sequence.
+        A failed action results in an error observation, so that the
+        remaining actions of the sequence still get executed.
+
+        Args:
+            action_spec: Dictionary with the `action` and its `action_input`
+
+        Returns:
+            ReActObservation with action result (or error)
+        """
+        action_name = action_spec.get("action")
+        action_input_json = action_spec.get("action_input", "{}")
+
+        # Create temporary thought for this action
+        temp_thought = ReActThought(
+            thought=f"Executing {action_name} from batch",
+            action=action_name,
+            action_input=action_input_json,
+            should_continue=True
+        )
+
+        try:
+            return await self._execute_action(thought=temp_thought)
+        except Exception as e:
+            logger.warning(f"Batch action '{action_name}' failed: {e}")
+            return ReActObservation(
+                action=action_name,
+                result={"error": f"Batch action failed: {str(e)}"},
+                timestamp=datetime.now()
+            )
+
     def _extract_reasoning(self, history: ReActHistory) -> List[str]:
         """
         Helper function (used by an agent subclass) to extract reasoning trace
@@ -443,10 +512,13 @@ INVALID (will cause errors):
         Returns:
             Formatted context string
         """
-        parts = []
-        for key, value in state.context.items():
-            parts.append(f"- {key}: {value}")
-        return "\n".join(parts) if parts else "No context provided"
+        buf = io.StringIO()
+        write = buf.write
+        for i, (key, value) in enumerate(state.context.items()):
+            if i:
+                write("\n")
+            write(f"- {key}: {value}")
+        return buf.getvalue() or "No context provided"
 
     def _format_history(self, history: ReActHistory) -> str:
         """
@@ -462,35 +534,52 @@ INVALID (will cause errors):
         if not history.thoughts:
             return ""
 
-        parts = []
+        # Written to a buffer rather than joined from a list, so very long
+        # traces do not hold every fragment in memory twice. Each fragment
+        # is prefixed with the newline the join used to insert.
+        buf = io.StringIO()
+        write = buf.write
         # Handle variable number of observations per thought
         # due to batch actions
         obs_idx = 0
         for i, thought in enumerate(history.thoughts):
-            parts.append(f"\nIteration {i+1}:")
-            parts.append(f"  Thought: {thought.thought}")
+            write("\n\n" if i else "\n")
+            write(f"Iteration {i+1}:")
+            write(f"\n  Thought: {thought.thought}")
 
             if thought.actions:
-                parts.append("  Action Sequence:")
+                write("\n  Action Sequence:")
                 for j, action_spec in enumerate(thought.actions):
                     act_name = action_spec.get("action", "unknown")
                     act_input = action_spec.get("action_input", "{}")
-                    parts.append(f"    {j+1}. {act_name}({act_input})")
+                    write(f"\n    {j+1}. {act_name}({act_input})")
                     # Add observation if available
                     if obs_idx < len(history.observations):
                         obs = history.observations[obs_idx]
-                        parts.append(f"      Observation: {obs.result}")
+                        write(f"\n      Observation: {obs.result}")
                         obs_idx += 1
             elif thought.action:
                 act_str = f"  Action: {thought.action}({thought.action_input})"
-                parts.append(act_str)
+                write(f"\n{act_str}")
                 # Add observation if available
                 if obs_idx < len(history.observations):
                     obs = history.observations[obs_idx]
-                    parts.append(f"  Observation: {obs.result}")
+                    write(f"\n  Observation: {obs.result}")
                     obs_idx += 1
 
-        return "\n".join(parts)
+        return buf.getvalue()
+
+    def _get_action_keys(
+            self,
+            thought: ReActThought) -> List[Tuple[str, str]]:
+        """
+        Helper function used to get the (action, action_input) pairs that
+        executing the indicated thought will run, in execution order.
+        """
+        if thought.actions:
+            return [(spec.get("action") or "", spec.get("action_input", "{}"))
+                    for spec in thought.actions]
+        return [(thought.action or "", thought.action_input or "")]
 
     def _get_action_or_actions_formatting_lines(self) -> List[str]:
         return [
@@ -531,6 +620,27 @@ INVALID (will cause errors):
     def _get_json_formatting_rules(self) -> str:
         return "\n".join(self._get_json_formatting_lines())
 
+    def _get_thought_cache_key(
+            self,
+            state: AgentState,
+            history: ReActHistory) -> bytes:
+        """
+        Helper function used to compute the thought cache key from the
+        formatted context, the available tools and the most recent thoughts
+        and observations.
+        """
+        n = self.THOUGHT_CACHE_TAIL
+        key_data = {
+            "agent": self.__class__.__name__,
+            "ctx": self._format_context(state),
+            "tools": sorted(self._get_tools().keys()),
+            "tail": [(t.action, t.action_input, t.actions)
+                     for t in history.thoughts[-n:]],
+            "obs": [(o.action, o.result) for o in history.observations[-n:]],
+        }
+        serialised = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.blake2b(serialised.encode("utf-8")).digest()
+
     async def _get_thought(
         self,
         state: AgentState,
@@ -547,6 +657,16 @@ INVALID (will cause errors):
         Returns:
             ReActThought with reasoning and action
         """
+        # Check cache first
+        cache_key = self._get_thought_cache_key(state, history)
+        cached = self._thought_cache.get(cache_key)
+        if cached is not None \
+                and time.time() - cached["timestamp"] < self.thought_cache_ttl:
+            self._thought_cache.move_to_end(cache_key)
+            logger.debug("Thought cache hit")
+            # Copy, since the loop may modify the thought's action
+            return cached["result"].model_copy(deep=True)
+
         prompt = self._build_react_prompt(state, history)
 
         messages = [
@@ -554,17 +674,97 @@ INVALID (will cause errors):
             {"role": "user", "content": prompt}
         ]
 
+        # The system prompt is the same on every iteration, so requests from
+        # the same agent share a prefix the provider can cache
         thought = await self._call_llm(
             messages=messages,
             response_format=ReActThought,
+            prompt_cache_key=self.__class__.__name__,
         )
 
+        # Store in cache (evicting the least recently used entry)
+        if self.thought_cache_ttl > 0:
+            self._thought_cache[cache_key] = {
+                "result": thought.model_copy(deep=True),
+                "timestamp": time.time()
+            }
+            self._thought_cache.move_to_end(cache_key)
+            if len(self._thought_cache) > self.THOUGHT_CACHE_MAX_ENTRIES:
+                self._thought_cache.popitem(last=False)
+
         # Log the parsed thought for debugging
-        logger.debug(
-            f"LLM returned ReActThought: "
-            f"action={thought.action}, "
-            f"action_input={repr(thought.action_input)}, "
-            f"should_continue={thought.should_continue}"
-        )
+        logger.debug("LLM returned ReActThought: action=%s, "
+                     "action_input=%r, should_continue=%s",
+                     thought.action,
+                     thought.action_input,
+                     thought.should_continue)
 
         return thought
+
+    def _predict_observations(
+            self,
+            action_keys: List[Tuple[str, str]],
+            last_results: Dict[Tuple[str, str], Dict[str, Any]]
+    ) -> Optional[List[ReActObservation]]:
+        """
+        Helper function used to predict the observations of the actions about
+        to be executed, from the results of identical earlier actions.
+
+        Returns:
+            List of predicted observations, or None if speculation is
+            disabled or any action has not been executed before
+        """
+        if not self.speculative_thoughts \
+                or not all(key in last_results for key in action_keys):
+            return None
+        return [ReActObservation(action=key[0], result=last_results[key])
+                for key in action_keys]
+
+    async def _resolve_speculation(
+            self,
+            spec_task: asyncio.Task,
+            predicted: Optional[List[ReActObservation]],
+            actual: List[ReActObservation]) -> Optional[ReActThought]:
+        """
+        Helper function used to decide whether a speculative thought can be
+        used as the next thought. It is used only if the actual observations
+        match the predicted ones; otherwise it is cancelled. Speculation is
+        switched off after `MAX_SPECULATION_MISSES` consecutive misses.
+
+        Returns:
+            The speculative thought if confirmed, None otherwise
+        """
+        predicted = predicted or []
+        if [o.result for o in predicted] == [o.result for o in actual]:
+            try:
+                thought = await spec_task
+                self._speculation_hits += 1
+                self._speculation_misses = 0
+                return thought
+            except Exception as e:
+                logger.warning(f"Speculative thought failed: {e}")
+                return None
+
+        spec_task.cancel()
+        self._speculation_misses += 1
+        if self._speculation_misses >= self.MAX_SPECULATION_MISSES:
+            logger.info(f"{self.__class__.__name__} disabling speculative "
+                        f"thoughts after {self._speculation_misses} misses "
+                        f"({self._speculation_hits} hits)")
+            self.speculative_thoughts = False
+        return None
+
+    def _validate_action(self, name: Optional[str]) -> None:
+        """
+        Helper function used to check that the action is one of the tools
+        available to this agent.
+
+        Args:
+            name: Name of the action/tool
+
+        Raises:
+            InvalidActionError: If the action is not an available tool
+        """
+        tools = self._get_tools()
+        if name is None or name not in tools:
+            raise InvalidActionError(name, list(tools.keys()))
@@ -1,10 +1,22 @@
+import asyncio
+import io
+import json
+import re
+import time
+
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from typing import (
+    Any,
     Callable,
     Dict,
     List,
+    Optional,
+    Tuple,
 )
 
+from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.agents.react_agent import ReActAgent
 from agentic_fs_archaeologist.memory import (
     MemoryRetrieval,
@@ -16,11 +28,16 @@ from agentic_fs_archaeologist.tools.reflection_tools import ReflectionTools
 from agentic_fs_archaeologist.models import (
     AgentResult,
     AgentState,
+    Classification,
     ReflectionCritique,
+    ReflectionOutcome,
     ReActHistory,
 )
 
 
+logger = get_logger(__name__)
+
+
 class ReflectionAgent(ReActAgent):
     """
     An autonomous reflection agent that reviews classifications for errors.
@@ -29,7 +46,7 @@ class ReflectionAgent(ReActAgent):
     """
 
     # System paths that should never be deleted
-    SYSTEM_PATHS = [
+    SYSTEM_PATHS = (
         "/System",
         "/Library",
         "/usr",
@@ -42,19 +59,30 @@ class ReflectionAgent(ReActAgent):
         "C:\\Windows",
         "C:\\Program Files",
         "C:\\Program Files (x86)",
-    ]
+    )
 
     # Important user directories to be cautious about
-    IMPORTANT_DIRS = [
+    IMPORTANT_DIRS = (
         "Desktop",
         "Documents",
         "Downloads",
         "Photos",
         "Pictures",
-    ]
+    )
+
+    # Precompiled matchers for the two tuples above, so that each check is a
+    # single regex scan rather than one substring test per entry
+    _SYSTEM_PATHS_RE = re.compile(
+        "|".join(re.escape(sys_path) for sys_path in SYSTEM_PATHS))
+    _IMPORTANT_DIRS_RE = re.compile(
+        "/(?:{0})/|\\\\(?:{0})\\\\".format(
+            "|".join(re.escape(d) for d in IMPORTANT_DIRS)))
+
+    # Used to count critiques that mention learning (from past decisions)
+    _LEARNING_RE = re.compile("learning", re.IGNORECASE)
 
     # File extensions that are safe to delete from Downloads
-    CLEANUP_SAFE_EXTENSIONS = [
+    CLEANUP_SAFE_EXTENSIONS = frozenset({
         ".exe",
         ".msi",
         ".dmg",
@@ -67,13 +95,68 @@ class ReflectionAgent(ReActAgent):
         ".bz2",  # Archives
         ".iso",
         ".img",  # Disk images
-    ]
+    })
+
+    # The evidence-gathering tools are independent of each other, so the
+    # actions of an action sequence are executed concurrently
+    PARALLEL_ACTIONS = True
+
+    # Number of classifications critiqued per LLM call, and the maximum
+    # number of those LLM calls in flight at once (to respect rate limits)
+    REVIEW_BATCH_SIZE = 32
+    REVIEW_MAX_CONCURRENT_BATCHES = 4
+    # Whether classifications in the same directory with the same
+    # recommendation and confidence are reviewed as one group
+    REVIEW_GROUP_BY_PARENT = True
 
     def __init__(self):
         super().__init__()
-        # Create shared memory once in constructor
-        self.memory_store = MemoryStore()
-        self.memory_retrieval = MemoryRetrieval(self.memory_store)
+        # Shared memory is created on first use (see the properties below)
+        self._memory_store: Optional[MemoryStore] = None
+        self._memory_retrieval: Optional[MemoryRetrieval] = None
+        # Reflection outcomes recorded by the LLM, saved in one transaction
+        # (see `_flush_reflection_outcomes`)
+        self._pending_outcomes: List[ReflectionOutcome] = []
+        # Session cache of batch review outcomes (the critique, or None if
+        # no issues were found), keyed by `_get_critique_cache_key`
+        self.critique_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self.critique_cache_ttl = self.settings.reflection_cache_ttl
+        # The tools are static, so build the tool dict once
+        self._tools_cache: Dict[str, Callable] = {
+            "get_file_metadata": self._get_file_metadata,
+            "check_file_dependencies": self._check_file_dependencies,
+            "search_related_patterns": self._search_related_patterns,
+            "query_reflection_history": self._query_reflection_history,
+            "analyze_reflection_accuracy_metrics":
+            self._analyse_reflection_accuracy_metrics,
+            "downgrade_confidence": self._downgrade_confidence,
+            "add_safety_risk": self._add_safety_risk,
+            "store_reflection_outcome": self._store_reflection_outcome,
+            "trigger_reclassification": self._trigger_reclassification,
+            "review_classifications_in_batches":
+            self._review_classifications_in_batches,
+            "finish": self._finish_with_critiques
+        }
+
+    @property
+    def memory_store(self) -> MemoryStore:
+        """
+        Helper function used to get the memory store, which is created (and
+        its database initialised) the first time a memory tool needs it.
+        """
+        if self._memory_store is None:
+            self._memory_store = MemoryStore()
+        return self._memory_store
+
+    @property
+    def memory_retrieval(self) -> MemoryRetrieval:
+        """
+        Helper function used to get the memory retrieval, which shares the
+        memory store and is created on first use.
+        """
+        if self._memory_retrieval is None:
+            self._memory_retrieval = MemoryRetrieval(self.memory_store)
+        return self._memory_retrieval
 
     async def _add_safety_risk(
             self,
@@ -86,9 +169,49 @@ class ReflectionAgent(ReActAgent):
             severity=severity)
 
     async def _analyse_reflection_accuracy_metrics(self) -> Dict:
+        self._flush_reflection_outcomes()
         return ReflectionTools.analyse_reflection_accuracy_metrics(
             memory_store=self.memory_store)
 
+    async def _batch_review(
+            self,
+            classifications: List[Classification]
+    ) -> Optional[List[ReflectionCritique]]:
+        """
+        Helper function used to critique a batch of classifications using a
+        single LLM call. Returns None if the LLM call fails or its response
+        cannot be parsed.
+        """
+        lines = []
+        for item in classifications:
+            size_str = format_file_size(item.estimated_savings_bytes)
+            lines.append(f"- {item.path} ({size_str}, "
+                         f"{item.recommendation.value}, "
+                         f"{item.confidence.value}) - "
+                         f"{item.reasoning[:200]}")
+
+        prompts = load_prompts(prompt_json_file_path=None)
+        prompt_lines = prompts["reflection_agent"]["batch_review_prompt_lines"]
+        prompt = "\n".join(prompt_lines).format(
+            classifications_str="\n".join(lines))
+        messages = [
+            {"role": "system", "content": self._build_system_prompt()},
+            {"role": "user", "content": prompt}
+        ]
+
+        try:
+            content = await self._call_llm(messages=messages)
+            # Tolerate text (e.g. code fences) around the JSON array
+            start, end = content.find("["), content.rfind("]")
+            items = json.loads(content[start:end + 1]) if start >= 0 else []
+        except Exception as e:
+            logger.warning(f"Batch review of {len(classifications)} "
+                           f"classifications failed: {e}")
+            return None
+
+        critiques = (self._parse_critique(item) for item in items)
+        return [critique for critique in critiques if critique is not None]
+
     def _build_react_prompt(
             self,
             state: AgentState,
@@ -101,6 +224,9 @@ class ReflectionAgent(ReActAgent):
         history_str = self._format_history(history=history)\
             if history.thoughts else ""
 
+        # Get action formatting rules
+        action_formatting_rules = self._get_action_or_actions_formatting()
+
         # Get the JSON formatting rules
         json_formatting_rules = self._get_json_formatting_rules()
 
@@ -114,13 +240,15 @@ class ReflectionAgent(ReActAgent):
             context_str=context_str,
             history_str=history_str,
             tools_str=tools_str,
+            action_formatting_rules=action_formatting_rules,
             json_formatting_rules=json_formatting_rules
         )
 
         return formatted_prompt
 
     async def _check_file_dependencies(self, path: str) -> Dict:
-        return ReflectionTools.check_file_dependencies(path)
+        return await asyncio.to_thread(
+            ReflectionTools.check_file_dependencies, path)
 
     async def _compile_results(
         self,
@@ -138,19 +266,26 @@ class ReflectionAgent(ReActAgent):
             if observation.result and "critiques" in observation.result:
                 critiques.extend(observation.result["critiques"])
 
+        # Index the classifications by path once (keeping the first match,
+        # as before) instead of scanning all of them for every critique
+        classifications_by_path = {}
+        for cls in state.classifications:
+            classifications_by_path.setdefault(cls.path, cls)
+
         # Apply any critiques to the classifications
         for critique in critiques:
             # Find and modify the matching classification
-            matching_cls = next(
-                (cls for cls in state.classifications
-                 if cls.path == Path(critique.classification_path)),
-                None
-            )
+            # (`classification_path` is already converted to a `Path`)
+            matching_cls = classifications_by_path.get(
+                critique.classification_path)
             if matching_cls and critique.suggested_confidence:
                 matching_cls.confidence = critique.suggested_confidence
-                matching_cls.risks.extend(critique.additional_risks)
+                if critique.additional_risks:
+                    matching_cls.risks.extend(critique.additional_risks)
 
-        tools_used = list(self._get_tools().keys())
+        tools_used = list(self._tools_cache)
+        n_learning = sum(1 for c in critiques
+                         if self._LEARNING_RE.search(c.critique_reasoning))
         return AgentResult(
             success=True,
             data={"critiques": critiques},
@@ -159,9 +294,7 @@ class ReflectionAgent(ReActAgent):
                 "using LLM self-critique",
                 f"Applied {len(critiques)} critiques "
                 "with enhanced safety reasoning",
-                "Used learning tools to inform "
-                f"{len([c for c in critiques if "learning"
-                        in c.critique_reasoning.lower()])} decisions"
+                f"Used learning tools to inform {n_learning} decisions"
             ],
             metadata={
                 "total_reviewed": len(state.classifications),
@@ -178,76 +311,130 @@ class ReflectionAgent(ReActAgent):
             reasoning: str) -> Dict:
         return ReflectionTools.downgrade_confidence(path, level, reasoning)
 
-    def _finish_with_critiques(
+    async def execute(self, state: AgentState) -> AgentResult:
+        """
+        Used to store the state for tools to access.
+        """
+        self._current_state = state
+        try:
+            return await super().execute(state)
+        finally:
+            self._flush_reflection_outcomes()
+
+    async def _finish_with_critiques(
             self,
-            critiques: List[ReflectionCritique]) -> Dict:
+            critiques: Optional[list] = None,
+            items: Optional[list] = None) -> Dict:
         """
         Helper function used for the finish action that compiles critiques
-        into final result format.
+        into final result format. Critiques are parsed here once (the LLM
+        passes them as JSON objects), so that `_compile_results` only has to
+        look up their paths. Accepts either 'critiques' or 'items' parameter
+        for flexibility.
         """
-        return {"critiques": critiques}
+        result_list = critiques if critiques is not None else items
+        parsed = (self._parse_critique(item) for item in result_list or [])
+        return {"critiques": [c for c in parsed if c is not None]}
+
+    def _flush_reflection_outcomes(self):
+        """
+        Helper function used to save the pending reflection outcomes in a
+        single transaction (before they are queried, and when the agent
+        finishes).
+        """
+        if self._pending_outcomes:
+            self.memory_store.save_reflection_outcomes(self._pending_outcomes)
+            self._pending_outcomes = []
 
     def _format_context(self, state: AgentState) -> str:
         """
         Helper function used to include classifications in context.
         It overrides the `_format_context` function of the `ReActAgent`.
         """
-        parts = []
+        buf = io.StringIO()
+        write = buf.write
 
         # Include basic context
         for key, value in state.context.items():
-            parts.append(f"- {key}: {value}")
+            write(f"- {key}: {value}\n")
 
         # Include classifications to review
         if state.classifications:
             n = len(state.classifications)
-            parts.append(f"\nClassifications to review ({n} total):")
+            write(f"\nClassifications to review ({n} total):\n")
             # Show first 10
-            for i, item in enumerate(state.classifications[:10], 1):
-                size_str = format_file_size(item.estimated_savings_bytes)
-                parts.append(f"  {i}. {item.path} ({size_str}, "
-                             f"{item.recommendation.value}, "
-                             f"{item.confidence.value}) - "
-                             f"{item.reasoning[:100]}...")
+            for i, item in enumerate(islice(state.classifications, 10), 1):
+                write(f"  {i}. {item.path} "
+                      f"({format_file_size(item.estimated_savings_bytes)}, "
+                      f"{item.recommendation.value}, "
+                      f"{item.confidence.value}) - "
+                      f"{item.reasoning[:100]}...\n")
             if n > 10:
-                parts.append(f"  ... and {n - 10} more classifications")
-
-        return "\n".join(parts) if parts else "No context provided"
+                write(f"  ... and {n - 10} more classifications\n")
+
+        # Drop the trailing newline
+        text = buf.getvalue()
+        return text[:-1] if text else "No context provided"
+
+    def _get_action_or_actions_formatting_lines(self) -> List[str]:
+        return [
+            "You can execute single actions "
+            "OR action sequences for efficiency:",
+            "",
+            "Single Action:",
+            "{{\"action\": \"get_file_metadata\", "
+            "\"action_input\": \"{{\\\"path\\\": \\\"/tmp/a.zip\\\"}}\"}}",
+            "",
+            "Action Sequence (recommended for independent evidence "
+            "gathering, the actions are executed in parallel):",
+            "{{\"actions\": ["
+            "  {{\"action\": \"get_file_metadata\", "
+            "\"action_input\": \"{{\\\"path\\\": \\\"/tmp/a.zip\\\"}}\"}},",
+            "  {{\"action\": \"check_file_dependencies\", "
+            "\"action_input\": \"{{\\\"path\\\": \\\"/tmp/a.zip\\\"}}\"}}",
+            "]}}",
+        ]
 
     async def _get_file_metadata(self, path: str) -> Dict:
-        return ReflectionTools.get_file_metadata(path)
+        return await asyncio.to_thread(ReflectionTools.get_file_metadata, path)
+
+    def _get_critique_cache_key(self, classification: Classification) -> Tuple:
+        """
+        Helper function used to get the key of the critique cache for a
+        classification.
+        """
+        return (
+            str(classification.path),
+            classification.recommendation.value,
+            classification.confidence.value,
+            classification.estimated_savings_bytes,
+        )
+
+    def _get_review_group_key(self, classification: Classification) -> Tuple:
+        """
+        Helper function used to get the key of the group of similar
+        classifications that a classification is reviewed with.
+        """
+        path = classification.path
+        return (
+            path.parent if self.REVIEW_GROUP_BY_PARENT else path,
+            classification.recommendation,
+            classification.confidence,
+        )
 
     def _get_tools(self) -> Dict[str, Callable]:
         """
         Helper function used to get the tools available to the reflection
         agent.
         """
-
-        return {
-            "get_file_metadata": self._get_file_metadata,
-            "check_file_dependencies": self._check_file_dependencies,
-            "search_related_patterns": self._search_related_patterns,
-            "query_reflection_history": self._query_reflection_history,
-            "analyze_reflection_accuracy_metrics":
-            self._analyse_reflection_accuracy_metrics,
-            "downgrade_confidence": self._downgrade_confidence,
-            "add_safety_risk": self._add_safety_risk,
-            "store_reflection_outcome": self._store_reflection_outcome,
-            "trigger_reclassification": self._trigger_reclassification,
-            "finish": self._finish_with_critiques
-        }
+        return self._tools_cache
 
     def _in_important_dir(self, path: Path) -> bool:
         """
         Helper function used to check if the indicated path is in an important
         user directory.
         """
-        path_str = str(path)
-        for important_dir in self.IMPORTANT_DIRS:
-            if f"/{important_dir}/" in path_str or \
-                    f"\\{important_dir}\\" in path_str:
-                return True
-        return False
+        return self._IMPORTANT_DIRS_RE.search(str(path)) is not None
 
     def _is_cleanup_safe_file(self, path: Path) -> bool:
         """
@@ -263,19 +450,115 @@ class ReflectionAgent(ReActAgent):
         Helper function used to check if the indicated path is a system path
         that should never be deleted.
         """
-        path_str = str(path)
-        for sys_path in self.SYSTEM_PATHS:
-            if path_str.startswith(sys_path):
-                return True
-        return False
+        return self._SYSTEM_PATHS_RE.match(str(path)) is not None
+
+    def _parse_critique(self, item: Any) -> Optional[ReflectionCritique]:
+        """
+        Helper function used to convert a critique given by the LLM (as a
+        JSON object) into a `ReflectionCritique`. Returns None if it cannot be
+        parsed.
+        """
+        if isinstance(item, ReflectionCritique):
+            return item
+        try:
+            return ReflectionCritique(
+                classification_path=item.get("classification_path")
+                or item["path"],
+                issues_found=item.get("issues_found") or [],
+                suggested_confidence=item.get("suggested_confidence"),
+                additional_risks=item.get("additional_risks") or [],
+                should_review=item.get("should_review", True),
+                critique_reasoning=item.get("critique_reasoning", "")
+            )
+        except Exception as e:
+            logger.warning(f"Skipping unparseable critique {item}: {e}")
+            return None
 
     async def _query_reflection_history(self, path_pattern: str) -> Dict:
-        return ReflectionTools.query_reflection_history(
+        self._flush_reflection_outcomes()
+        return await asyncio.to_thread(
+            ReflectionTools.query_reflection_history,
             path_pattern=path_pattern,
             memory_store=self.memory_store)
 
+    async def _review_classifications_in_batches(self) -> Dict:
+        """
+        Critique all classifications, several per LLM call (batches run
+        concurrently).
+        """
+        # This will be set when the agent runs
+        if not hasattr(self, "_current_state"):
+            return {"critiques": [], "reviewed": 0}
+
+        classifications = self._current_state.classifications
+
+        # Reuse the outcome of earlier reviews of unchanged classifications
+        critiques, to_review = [], []
+        now = time.time()
+        for classification in classifications:
+            key = self._get_critique_cache_key(classification)
+            cached = self.critique_cache.get(key)
+            ttl = self.critique_cache_ttl
+            if cached and (now - cached["timestamp"]) < ttl:
+                if cached["critique"] is not None:
+                    critiques.append(cached["critique"])
+            else:
+                to_review.append(classification)
+
+        # Review one representative (the largest item) per group of similar
+        # classifications, and apply its critique to the whole group
+        groups: Dict[Tuple, List[Classification]] = defaultdict(list)
+        for classification in to_review:
+            key = self._get_review_group_key(classification)
+            groups[key].append(classification)
+        representatives = {
+            key: max(members, key=lambda c: c.estimated_savings_bytes)
+            for key, members in groups.items()}
+
+        iterator = iter(representatives.items())
+        batches = []
+        while batch := list(islice(iterator, self.REVIEW_BATCH_SIZE)):
+            batches.append(batch)
+
+        semaphore = asyncio.Semaphore(self.REVIEW_MAX_CONCURRENT_BATCHES)
+
+        async def review(batch: List[Tuple[Tuple, Classification]]):
+            async with semaphore:
+                return await self._batch_review(
+                    classifications=[rep for _, rep in batch])
+
+        results = await asyncio.gather(*(review(b) for b in batches))
+        now = time.time()
+        for batch, result in zip(batches, results):
+            if result is None:
+                continue  # Failed batches are not cached
+            by_path = {c.classification_path: c for c in result}
+            for key, rep in batch:
+                critique = by_path.get(rep.path)
+                for member in groups[key]:
+                    member_critique = critique
+                    if critique is not None and member is not rep:
+                        member_critique = critique.model_copy(
+                            update={"classification_path": member.path})
+                    if member_critique is not None:
+                        critiques.append(member_critique)
+                    if self.critique_cache_ttl > 0:
+                        cache_key = self._get_critique_cache_key(member)
+                        self.critique_cache[cache_key] = {
+                            "critique": member_critique,
+                            "timestamp": now
+                        }
+
+        n_cached = len(classifications) - len(to_review)
+        logger.info(f"Reviewed {len(classifications)} classifications in "
+                    f"{len(batches)} batches ({len(representatives)} "
+                    f"groups), {n_cached} from cache "
+                    f"({len(critiques)} critiques)")
+        return {"critiques": critiques, "reviewed": len(classifications)}
+
     async def _search_related_patterns(self, criteria: str) -> Dict:
-        return ReflectionTools.search_related_patterns(
+        return await asyncio.to_thread(
+            ReflectionTools.search_related_patterns,
             criteria=criteria,
             memory=self.memory_retrieval)
 
@@ -292,7 +575,7 @@ class ReflectionAgent(ReActAgent):
             reasoning=reasoning,
             confidence_before=confidence_before,
             confidence_after=confidence_after,
-            memory_store=self.memory_store)
+            pending_outcomes=self._pending_outcomes)
 
     async def _trigger_reclassification(
             self,
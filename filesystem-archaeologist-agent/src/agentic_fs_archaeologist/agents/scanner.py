@@ -1,10 +1,15 @@
+import asyncio
 import time
 
+from functools import partial
+from operator import itemgetter
 from typing import (
     Callable,
     Dict,
     List,
     Optional,
+    Set,
+    Tuple,
 )
 
 from agentic_fs_archaeologist.app_logger import get_logger
@@ -16,7 +21,11 @@ from agentic_fs_archaeologist.models import (
     AgentResult,
     ReActHistory,
 )
-from agentic_fs_archaeologist.tools import FileSystemTools
+from agentic_fs_archaeologist.tools import (
+    FileSystemTools,
+    fs_executor_var,
+    run_in_fs_executor,
+)
 
 
 logger = get_logger(__name__)
@@ -31,22 +40,85 @@ class ScannerAgent(ReActAgent):
     - Batch Action Sequences: Executes multiple related operations
       per reasoning step
     - Dynamic Tool Filtering: Only loads relevant tools based on current state
-    - Result Accumulation: Builds findings incrementally across operations
+    - Result Tracking: Counts findings across operations, without holding
+      the items (the tool results already carry them)
+    - Background CSV Updates: Marks scanned paths as visited while the next
+      reasoning step runs, rewriting the CSV once per batch of paths
+    - Monitoring Pre-execution: Collects the monitoring data in the
+      background while the first reasoning step runs, if it will be needed
     """
 
+    # How often the monitoring data is collected (and its tools offered)
+    MONITORING_INTERVAL_SECS = 1800
+
+    # Number of scanned paths buffered before the CSV is rewritten
+    SCANNED_PATHS_FLUSH_THRESHOLD = 256
+
     def __init__(self):
         super().__init__()
-        self.findings = []  # Accumulate partial results
+        self.findings_count = 0  # Number of items found so far
         settings = get_settings()
         self.scan_threshold_mb = settings.scan_min_size_mb
+        # When monitoring data was last collected (monotonic clock)
+        self._monitoring_data_collected: Optional[float] = None
+        # Monitoring tool results collected ahead of time, and the task
+        # collecting them (see `_warm_monitoring_data`)
+        self._warm_results: Dict[str, Dict] = {}
+        self._warm_task: Optional[asyncio.Task] = None
+        # Number of CSV updates started, used to discard stale warm results
+        self._csv_updates_started = 0
+        # Background CSV updates, and a lock to run them one at a time
+        self._scanned_buffer: List[str] = []
+        self._pending_writes: Set[asyncio.Task] = set()
+        self._csv_lock = asyncio.Lock()
+        # Build the tool groups once; `_get_tools` only merges them
+        self._base_tools: Dict[str, Callable] = {
+            "select_random_unvisited_directory":
+            self._select_random_unvisited_directory,
+            "scan_directory": self._scan_directory,
+            "finish": self._finish,
+        }
+        self._monitoring_tools: Dict[str, Callable] = {
+            "get_disk_usage": self._get_disk_usage,
+            "get_recycle_bin_stats": self._get_recycle_bin_stats,
+            "check_directory_changes": self._check_directory_changes,
+        }
+        self._analysis_tools: Dict[str, Callable] = {
+            "analyse_directory": self._analyse_directory,
+        }
+        # Merged tools, keyed on (needs monitoring data, has scan results)
+        self._tools_by_state: Dict[Tuple[bool, bool],
+                                   Dict[str, Callable]] = {}
+
+        # Prepare the prompt templates once, rather than on every iteration
+        scanner_agent_prompt = \
+            load_prompts(prompt_json_file_path=None)["scanner_agent"]
+        self._react_template = "\n".join(
+            scanner_agent_prompt.get("react_prompt_lines", []))
+        if "system_prompt_lines" in scanner_agent_prompt:
+            lines = scanner_agent_prompt["system_prompt_lines"]
+            prompt_text = "\n".join(lines)
+            prompt_text = prompt_text.replace(">1GB",
+                                              f">{self.scan_threshold_mb}MB")
+        else:
+            prompt_text = scanner_agent_prompt["system_prompt"]
+        # The formatting rules do not change between iterations, so they go
+        # in the system prompt, keeping the static prefix of every request
+        # identical (which lets the provider reuse its prompt cache)
+        self._system_prompt_text = "\n\n".join([
+            prompt_text,
+            self._get_action_or_actions_formatting(),
+            self._get_json_formatting_rules(),
+        ])
 
     async def _analyse_directory(
             self, path: str, depth: Optional[int] = None) -> Dict:
         """
         Helper function used to analyse directory wrapper.
         """
-        logger.debug(f"Analysing directory {path}")
-        return FileSystemTools.analyse_directory(path=path, depth=depth)
+        logger.debug("Analysing directory %s", path)
+        return await run_in_fs_executor(
+            FileSystemTools.analyse_directory, path=path, depth=depth)
 
     def _build_react_prompt(
             self,
@@ -60,23 +132,11 @@ class ScannerAgent(ReActAgent):
         history_str = self._format_history(history=history)\
             if history.thoughts else ""
 
-        # Get action formatting rules
-        action_formatting_rules = self._get_action_or_actions_formatting()
-
-        # Get the JSON formatting rules
-        json_formatting_rules = self._get_json_formatting_rules()
-
-        prompts = load_prompts(prompt_json_file_path=None)
-        k = "react_prompt_lines"
-        prompt_lines = prompts["scanner_agent"].get(k, [])
-
-        # Join the lines and format the template
-        template = "\n".join(prompt_lines)
-        formatted_prompt = template.format(
+        # Format the template (prepared in the constructor); the action and
+        # JSON formatting rules are part of the system prompt
+        formatted_prompt = self._react_template.format(
             context_str=context_str,
             history_str=history_str,
-            action_formatting_rules=action_formatting_rules,
-            json_formatting_rules=json_formatting_rules
         )
 
         return formatted_prompt
@@ -84,18 +144,9 @@ class ScannerAgent(ReActAgent):
     def _build_system_prompt(self) -> str:
         """
         Helper function used to build system prompt for scanner agent.
+        The prompt is prepared once in the constructor.
         """
-        prompts = load_prompts(prompt_json_file_path=None)
-        scanner_agent_prompt = prompts["scanner_agent"]
-        if "system_prompt_lines" in scanner_agent_prompt:
-            lines = scanner_agent_prompt["system_prompt_lines"]
-            prompt_text = "\n".join(lines)
-            prompt_text = prompt_text.replace(">1GB",
-                                              f">{self.scan_threshold_mb}MB")
-        else:
-            prompt_text = scanner_agent_prompt["system_prompt"]
-
-        return prompt_text
+        return self._system_prompt_text
 
     async def _check_directory_changes(
         self,
@@ -104,7 +155,13 @@ class ScannerAgent(ReActAgent):
         """
         Async helper function used for directory change analysis.
         """
-        logger.debug(f"Checking directory changes from {csv_file}")
+        await self._flush_pending_writes()
+        logger.debug("Checking directory changes from %s", csv_file)
+        if csv_file == "filesystem_monitor.csv":
+            warm_result = await self._take_warm_result(
+                "check_directory_changes")
+            if warm_result is not None:
+                return warm_result
         return FileSystemTools.check_directory_changes(csv_file=csv_file)
 
     async def _compile_results(
@@ -115,17 +172,19 @@ class ScannerAgent(ReActAgent):
         """
         Helper function used to compile discovery results.
         """
+        await self._flush_pending_writes()
+
         # Find the finish observation
         findings = []
         for obs in history.observations:
             if obs.action == "finish":
                 findings = obs.result.get("findings", [])
-                logger.debug("Found finish observation with "
-                             f"{len(findings)} findings")
-                logger.debug(f"Observation result keys: {obs.result.keys()}")
+                logger.debug("Found finish observation with %d findings",
+                             len(findings))
+                logger.debug("Observation result keys: %s", obs.result.keys())
                 break
 
-        logger.debug(f"Returning discoveries: {len(findings)}")
+        logger.debug("Returning discoveries: %d", len(findings))
         return AgentResult(
             success=True,
             data={"discoveries": findings},
@@ -133,13 +192,27 @@ class ScannerAgent(ReActAgent):
             metadata={"total_opportunities": len(findings)}
         )
 
-    async def _extract_paths_from_scan(self, scan_result: Dict) -> List[str]:
+    async def execute(self, state: AgentState) -> AgentResult:
+        """
+        Used to execute the ReAct loop, collecting the monitoring data in the
+        background (while the LLM reasons) if it will be needed.
+        """
+        if self._needs_monitoring_data(
+                min_interval_secs=self.MONITORING_INTERVAL_SECS) and \
+                (self._warm_task is None or self._warm_task.done()):
+            self._warm_task = asyncio.create_task(
+                self._warm_monitoring_data())
+        try:
+            return await super().execute(state)
+        finally:
+            if self._warm_task is not None and not self._warm_task.done():
+                self._warm_task.cancel()
+
+    def _extract_paths_from_scan(self, scan_result: Dict) -> List[str]:
         """
         Helper function used to extract paths from scan_directory result
         """
-        if "items" not in scan_result:
-            return []
-        return [item["path"] for item in scan_result["items"]]
+        return list(map(itemgetter("path"), scan_result.get("items", ())))
 
     async def _finish(
         self,
@@ -162,13 +235,28 @@ class ScannerAgent(ReActAgent):
             "total": n_findings,
         }
 
+    async def _flush_pending_writes(self) -> None:
+        """
+        Helper function used to write any buffered scanned paths and wait for
+        the background CSV updates to complete, before the CSV is read again
+        or the agent finishes.
+        """
+        self._write_scanned_buffer()
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes,
+                                 return_exceptions=True)
+
     async def _get_disk_usage(self, path: str = "~") -> Dict:
         """
         Async helper function used for disk usage monitoring.
         """
-        logger.debug(f"Getting disk usage for {path}")
-        disk_usage = FileSystemTools.get_disk_usage(path=path)
-        self._monitoring_data_collected = time.time()
+        logger.debug("Getting disk usage for %s", path)
+        disk_usage = await self._take_warm_result("get_disk_usage") \
+            if path == "~" else None
+        if disk_usage is None:
+            disk_usage = await run_in_fs_executor(
+                FileSystemTools.get_disk_usage, path=path)
+        self._monitoring_data_collected = time.monotonic()
         return disk_usage
 
     async def _get_recycle_bin_stats(self) -> Dict:
@@ -176,7 +264,11 @@ class ScannerAgent(ReActAgent):
         Async helper function used for recycle bin statistics.
         """
         logger.debug("Getting recycle bin statistics")
-        return FileSystemTools.get_recycle_bin_stats()
+        warm_result = await self._take_warm_result("get_recycle_bin_stats")
+        if warm_result is not None:
+            return warm_result
+        return await run_in_fs_executor(
+            FileSystemTools.get_recycle_bin_stats)
 
     def _get_tools(self) -> Dict[str, Callable]:
         """
@@ -187,38 +279,33 @@ class ScannerAgent(ReActAgent):
         - Monitoring tools only available if data collection is needed
         - Analysis tools only available after successful scanning operations
         """
-
-        base_tools = {
-            "select_random_unvisited_directory":
-            self._select_random_unvisited_directory,
-            "scan_directory": self._scan_directory,
-            "finish": self._finish,
-        }
-        tools = {}
-        tools.update(base_tools)
-
         # Add monitoring tools only if needed
         # (check once in 30 minutes)
-        min_interval_secs = 1800
-        if self._needs_monitoring_data(min_interval_secs=min_interval_secs):
-            tools.update({
-                "get_disk_usage": self._get_disk_usage,
-                "get_recycle_bin_stats": self._get_recycle_bin_stats,
-                "check_directory_changes": self._check_directory_changes,
-            })
-
+        needs_monitoring = self._needs_monitoring_data(
+            min_interval_secs=self.MONITORING_INTERVAL_SECS)
         # Add analysis tools only if scanning occurred
-        if self._has_scan_results():
-            tools.update({
-                "analyse_directory": self._analyse_directory,
-            })
+        has_scan_results = self._has_scan_results()
+
+        # The tools only depend on these two flags, so the dict for each
+        # combination is built once and reused
+        state_key = (needs_monitoring, has_scan_results)
+        tools = self._tools_by_state.get(state_key)
+        if tools is not None:
+            return tools
+
+        tools = dict(self._base_tools)
+        if needs_monitoring:
+            tools.update(self._monitoring_tools)
+        if has_scan_results:
+            tools.update(self._analysis_tools)
+        self._tools_by_state[state_key] = tools
 
         # Check and log the number of tolls used
         num_tools = len(tools) if tools else 0
         if len(tools) < 4:
             logger.debug("Using base tools - optimal")
         else:
-            logger.debug(f"Using {num_tools} tools")
+            logger.debug("Using %d tools", num_tools)
 
         return tools
 
@@ -227,14 +314,25 @@ class ScannerAgent(ReActAgent):
         Helper function used to check if scanning has produced results for
         analysis.
         """
-        return bool(self.findings)
+        return self.findings_count > 0
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """
+        Helper function used to forget a completed background CSV update
+        and log it if it failed.
+        """
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Updating scanned paths failed: "
+                           f"{task.exception()}")
 
     def _needs_monitoring_data(self, min_interval_secs: int) -> bool:
         """
         Helper function used to check if monitoring data is still needed.
         """
-        return not hasattr(self, "_monitoring_data_collected") or \
-            time.time() - self._monitoring_data_collected > min_interval_secs
+        return self._monitoring_data_collected is None or \
+            time.monotonic() - self._monitoring_data_collected > \
+            min_interval_secs
 
     async def _scan_directory(
             self,
@@ -243,20 +341,27 @@ class ScannerAgent(ReActAgent):
         """
         Helper function used to scan directory wrapper.
         """
-        logger.debug(f"Scanning directory {path} with depth {depth}")
+        logger.debug("Scanning directory %s with depth %s", path, depth)
 
-        result = FileSystemTools.scan_directory(
+        # The scan is coordinated off the event loop; its listing and sizing
+        # work runs in the shared filesystem executor (if set)
+        result = await asyncio.to_thread(
+            FileSystemTools.scan_directory,
             path=path,
             depth=depth,
-            min_size_mb=self.scan_threshold_mb)
-
-        # Accumulate findings as discovered
-        if "items" in result:
-            self.findings.extend(result["items"])
-            # Auto-update CSV with discovered paths
-            paths_found = [item["path"] for item in result["items"]]
-            if paths_found:
-                await self._update_scanned_paths(paths_found)
+            min_size_mb=self.scan_threshold_mb,
+            executor=fs_executor_var.get(None))
+
+        # Count findings as discovered
+        items = result.get("items")
+        if items:
+            self.findings_count += len(items)
+            # Auto-update CSV with discovered paths, once enough of them
+            # are buffered (see `_write_scanned_buffer`)
+            self._scanned_buffer.extend(item["path"] for item in items)
+            if len(self._scanned_buffer) >= \
+                    self.SCANNED_PATHS_FLUSH_THRESHOLD:
+                self._write_scanned_buffer()
 
         return result
 
@@ -265,13 +370,82 @@ class ScannerAgent(ReActAgent):
         Async helper function used to select a random unvisited directory
         from the CSV.
         """
+        await self._flush_pending_writes()
         return FileSystemTools.select_random_unvisited_directory(
             csv_file="filesystem_monitor.csv")
 
+    async def _take_warm_result(self, tool_name: str) -> Optional[Dict]:
+        """
+        Helper function used to take the result of a monitoring tool which
+        was collected ahead of time (waiting for it if still being
+        collected). Returns None if there is no such result, or if it is
+        stale (i.e. older than the monitoring interval, or the CSV has been
+        updated since).
+        """
+        if self._warm_task is not None and not self._warm_task.done():
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                return None
+        entry = self._warm_results.pop(tool_name, None)
+        if entry is None or \
+                entry["csv_updates"] != self._csv_updates_started or \
+                time.monotonic() - entry["timestamp"] > \
+                self.MONITORING_INTERVAL_SECS:
+            return None
+        logger.debug("Using monitoring data collected ahead for %s",
+                     tool_name)
+        return entry["result"]
+
     async def _update_scanned_paths(self, paths: List[str]) -> Dict:
         """
         Async helper function used to update CSV to mark paths as visited
         """
-        return FileSystemTools.update_scanned_paths(
-            csv_file="filesystem_monitor.csv",
-            paths=paths)
+        self._csv_updates_started += 1
+        async with self._csv_lock:
+            return await asyncio.to_thread(
+                FileSystemTools.update_scanned_paths,
+                csv_file="filesystem_monitor.csv",
+                paths=paths)
+
+    async def _warm_monitoring_data(self) -> None:
+        """
+        Helper function used to collect the monitoring data (for the default
+        arguments of the monitoring tools) ahead of the LLM asking for it.
+        Does not mark the monitoring data as collected, so the monitoring
+        tools are still offered to the LLM.
+        """
+        csv_updates = self._csv_updates_started
+        funcs = {
+            "get_disk_usage": partial(
+                FileSystemTools.get_disk_usage, path="~"),
+            "get_recycle_bin_stats": FileSystemTools.get_recycle_bin_stats,
+            "check_directory_changes": partial(
+                FileSystemTools.check_directory_changes,
+                csv_file="filesystem_monitor.csv"),
+        }
+        results = await asyncio.gather(
+            *(run_in_fs_executor(func) for func in funcs.values()),
+            return_exceptions=True)
+        timestamp = time.monotonic()
+        for tool_name, result in zip(funcs, results):
+            if isinstance(result, Exception):
+                continue
+            self._warm_results[tool_name] = {
+                "result": result,
+                "timestamp": timestamp,
+                "csv_updates": csv_updates,
+            }
+
+    def _write_scanned_buffer(self) -> None:
+        """
+        Helper function used to update the CSV with the buffered scanned
+        paths in the background, so that the next LLM call does not wait
+        for the CSV I/O.
+        """
+        if not self._scanned_buffer:
+            return
+        paths, self._scanned_buffer = self._scanned_buffer, []
+        task = asyncio.create_task(self._update_scanned_paths(paths))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
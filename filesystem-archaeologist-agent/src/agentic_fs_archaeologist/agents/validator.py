@@ -1,6 +1,13 @@
+import asyncio
+import errno
 import os
+import re
+import stat
 
-from pathlib import Path
+from typing import (
+    Optional,
+    Tuple,
+)
 
 from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.agents.base import BaseAgent
@@ -12,6 +19,10 @@ from agentic_fs_archaeologist.models import (
     SafetyCheck,
     ValidationResult,
 )
+from agentic_fs_archaeologist.tools import (
+    get_stat_cache,
+    run_in_fs_executor,
+)
 
 
 logger = get_logger(__name__)
@@ -22,7 +33,9 @@ class ValidatorAgent(BaseAgent):
     Rule-based validator for safety checks (NOT agentic).
     """
 
-    SYSTEM_PATHS = [
+    # The path lists are tuples, as the precompiled regexes below are built
+    # from them and would not reflect later changes to them
+    SYSTEM_PATHS = (
         "/System",
         "/Library",
         "/usr",
@@ -35,9 +48,14 @@ class ValidatorAgent(BaseAgent):
         "C:\\Windows",
         "C:\\Program Files",
         "C:\\Program Files (x86)",
-    ]
+    )
+
+    # Alternatives are tried in list order, so the reported system path is
+    # the same one the former per-entry `startswith` loop would report
+    _SYSTEM_PATHS_RE = re.compile(
+        "|".join(re.escape(sys_path) for sys_path in SYSTEM_PATHS))
 
-    PROTECTED_PATTERNS = [
+    PROTECTED_PATTERNS = (
         ".git",
         ".ssh",
         "Desktop",
@@ -45,7 +63,48 @@ class ValidatorAgent(BaseAgent):
         "Downloads",
         "Photos",
         "Pictures",
-    ]
+    )
+
+    # Used to check all protected patterns with a single regex scan
+    _PROTECTED_RE = re.compile(
+        "|".join(re.escape(pattern) for pattern in PROTECTED_PATTERNS))
+
+    # Errors for which a path is reported as not existing (as `Path.exists`)
+    _NOT_EXISTS_ERRNOS = frozenset({
+        errno.ENOENT,
+        errno.ENOTDIR,
+        errno.EBADF,
+        errno.ELOOP,
+    })
+
+    # Write permission bits of the file mode (owner, group and others)
+    _WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+    # Whether running as a non-root user on POSIX (determined once)
+    _IS_NON_ROOT_POSIX = os.name == "posix" and os.geteuid() != 0
+
+    # Passed checks are the same for every path (and SafetyCheck is frozen),
+    # so these are shared rather than created per classification
+    _PATH_EXISTS_PASSED = SafetyCheck(
+        check_name="path_exists",
+        passed=True,
+        reason="Path exists",
+        severity="info")
+    _PROTECTED_PATTERN_PASSED = SafetyCheck(
+        check_name="protected_pattern",
+        passed=True,
+        reason="Not a protected pattern",
+        severity="info")
+    _SYSTEM_PATH_PASSED = SafetyCheck(
+        check_name="system_path",
+        passed=True,
+        reason="Not a system path",
+        severity="info")
+    _WRITE_PERMISSION_PASSED = SafetyCheck(
+        check_name="write_permission",
+        passed=True,
+        reason="Has write permission",
+        severity="info")
 
     async def execute(self, state: AgentState) -> AgentResult:
         """
@@ -60,19 +119,26 @@ class ValidatorAgent(BaseAgent):
 
             classifications = state.classifications or []
             n_classifications = len(classifications) if classifications else 0
-            logger.debug(f"Validating {n_classifications} classifications")
-            for classification in classifications:
-                validation = self._validate_classification(classification)
-                validations.append(validation)
+            logger.debug("Validating %d classifications", n_classifications)
+            # The checks are dominated by blocking filesystem calls, so the
+            # classifications are validated concurrently in worker threads
+            validations = list(await asyncio.gather(*(
+                run_in_fs_executor(self._validate_classification,
+                                   classification)
+                for classification in classifications)))
 
-                # Update classification if not safe
+            # Update classifications which are not safe, counting them in
+            # the same pass
+            unsafe_count = 0
+            for classification, validation in zip(classifications,
+                                                  validations):
                 if not validation.is_safe:
+                    unsafe_count += 1
                     classification.confidence = DeletionConfidence("unsafe")
                     classification.risks.extend(validation.blocking_issues)
 
             n_validations = len(validations)
-            safe_count = sum(1 for v in validations if v.is_safe)
-            unsafe_count = n_validations - safe_count
+            safe_count = n_validations - unsafe_count
             logger.info(f"Completed {n_validations} validations "
                         f"({safe_count} safe, {unsafe_count} unsafe)")
 
@@ -101,76 +167,104 @@ class ValidatorAgent(BaseAgent):
                 metadata={}
             )
 
-    def _is_protected_pattern(self, path: Path) -> tuple:
+    def _is_protected_pattern(self, path_str: str) -> tuple:
         """
-        Helper function used to check if path matches protected patterns.
+        Helper function used to check if path (given as a string) matches
+        protected patterns.
         """
-        path_str = str(path)
-        for pattern in self.PROTECTED_PATTERNS:
-            if pattern in path_str:
-                return True, f"Protected pattern: {pattern}"
-        return False, "Not a protected pattern"
+        if self._PROTECTED_RE.search(path_str) is None:
+            return False, "Not a protected pattern"
+        # Report the first pattern in list order (not the leftmost match),
+        # as before; this loop only runs for protected paths
+        pattern = next(p for p in self.PROTECTED_PATTERNS if p in path_str)
+        return True, f"Protected pattern: {pattern}"
 
-    def _is_system_path(self, path: Path) -> tuple:
+    def _is_system_path(self, path_str: str) -> tuple:
         """
-        Helper function used to check if path is a system path.
+        Helper function used to check if path (given as a string) is a
+        system path.
         """
-        path_str = str(path)
-        for sys_path in self.SYSTEM_PATHS:
-            if path_str.startswith(sys_path):
-                return True, f"System path: {sys_path}"
+        match = self._SYSTEM_PATHS_RE.match(path_str)
+        if match:
+            return True, f"System path: {match.group(0)}"
         return False, "Not a system path"
 
-    def _perform_path_exists_check(self, path: Path) -> SafetyCheck:
-        exists, unk_str = False, None
-        try:
-            exists = path.exists()
-        except OSError:
-            exists = False
-            unk_str = "Unable to determine existence"
-
-        reason_str = "Path exists" if exists else \
-            unk_str if unk_str else "Path does not exist"
+    def _perform_path_exists_check(
+            self,
+            st: Optional[os.stat_result],
+            unk_str: Optional[str]) -> SafetyCheck:
+        if st is not None:
+            return self._PATH_EXISTS_PASSED
         return SafetyCheck(
             check_name="path_exists",
-            passed=exists,
-            reason=reason_str,
-            severity="critical" if not exists else "info"
+            passed=False,
+            reason=unk_str if unk_str else "Path does not exist",
+            severity="critical"
         )
 
-    def _perform_protected_pattern_check(self, path: Path) -> SafetyCheck:
-        is_protected, reason = self._is_protected_pattern(path)
+    def _perform_protected_pattern_check(self, path_str: str) -> SafetyCheck:
+        is_protected, reason = self._is_protected_pattern(path_str)
+        if not is_protected:
+            return self._PROTECTED_PATTERN_PASSED
         return SafetyCheck(
             check_name="protected_pattern",
-            passed=not is_protected,
+            passed=False,
             reason=reason,
-            severity="warning" if is_protected else "info"
+            severity="warning"
         )
 
-    def _perform_system_path_check(self, path: Path) -> SafetyCheck:
-        is_system, reason = self._is_system_path(path)
+    def _perform_system_path_check(self, path_str: str) -> SafetyCheck:
+        is_system, reason = self._is_system_path(path_str)
+        if not is_system:
+            return self._SYSTEM_PATH_PASSED
         return SafetyCheck(
             check_name="system_path",
-            passed=not is_system,
+            passed=False,
             reason=reason,
-            severity="critical" if is_system else "info"
+            severity="critical"
         )
 
-    def _perform_write_permission_check(self, path: Path) -> SafetyCheck:
+    def _perform_write_permission_check(
+            self,
+            path_str: str,
+            st: os.stat_result) -> SafetyCheck:
         try:
-            has_permission = os.access(path, os.W_OK)
-            reason_str = "Has write permission" if has_permission \
-                else "No write permission"
+            # With no write bits set at all, only root could write; this
+            # avoids the access() syscall for read-only files
+            if st.st_mode & self._WRITE_BITS == 0 and self._IS_NON_ROOT_POSIX:
+                has_permission = False
+            else:
+                has_permission = os.access(path_str, os.W_OK)
+            reason_str = "No write permission"
         except OSError:
             has_permission = False
             reason_str = "Unable to check permissions"
+        if has_permission:
+            return self._WRITE_PERMISSION_PASSED
         return SafetyCheck(
             check_name="write_permission",
-            passed=has_permission,
+            passed=False,
             reason=reason_str,
-            severity="critical" if not has_permission else "info"
+            severity="critical"
         )
 
+    def _stat_path(
+            self,
+            path_str: str) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """
+        Helper function used to stat the path. Returns the stat result (None
+        if the path does not exist or cannot be checked) and the reason if
+        its existence could not be determined.
+        """
+        try:
+            return get_stat_cache().stat(path_str), None
+        except ValueError:
+            return None, None
+        except OSError as e:
+            if e.errno in self._NOT_EXISTS_ERRNOS:
+                return None, None
+            return None, "Unable to determine existence"
+
     def _validate_classification(
             self,
             classification: Classification) -> ValidationResult:
@@ -186,26 +280,30 @@ class ValidatorAgent(BaseAgent):
         blocking_issues = []
         warnings = []
 
-        path_to_check = classification.path
-        system_check = self._perform_system_path_check(path=path_to_check)
+        # Convert the path to a string once; all the checks use the string
+        # (converting a Path to a string is relatively costly)
+        path_str = str(classification.path)
+        system_check = self._perform_system_path_check(path_str=path_str)
         checks.append(system_check)
         if not system_check.passed:
             blocking_issues.append(system_check.reason)
 
-        pp_check = self._perform_protected_pattern_check(path=path_to_check)
+        pp_check = self._perform_protected_pattern_check(path_str=path_str)
         checks.append(pp_check)
         if not pp_check.passed:
             warnings.append(pp_check.reason)
 
-        exists_check = self._perform_path_exists_check(path=path_to_check)
+        # Stat the path once for both the existence and permission checks
+        st, unk_str = self._stat_path(path_str=path_str)
+        exists_check = self._perform_path_exists_check(st=st, unk_str=unk_str)
         checks.append(exists_check)
         if not exists_check.passed:
             blocking_issues.append(exists_check.reason)
 
         permission_check = None
         if exists_check.passed:
-            permission_check =\
-                self._perform_write_permission_check(path=path_to_check)
+            permission_check = self._perform_write_permission_check(
+                path_str=path_str, st=st)
             checks.append(permission_check)
             if not permission_check.passed:
                 blocking_issues.append(permission_check.reason)
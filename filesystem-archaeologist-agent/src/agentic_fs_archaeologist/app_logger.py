@@ -1,12 +1,17 @@
+import atexit
 import logging
 import logging.handlers
 import os
 import platform
+import queue
+import threading
 
 from pathlib import Path
 from typing import (
     Any,
     Dict,
+    List,
+    Optional,
 )
 
 
@@ -17,20 +22,46 @@ try:
 except ImportError:
     concurrent_handler_available = False
 
+# The log format does not use thread, process or source location details, so
+# skip collecting them for every log record
+logging.logThreads = False
+logging.logProcesses = False
+logging._srcfile = None
+
+
+# Records are put on a queue by the loggers, and written by the handlers in
+# a single listener thread (see `_start_log_listener`). The queue and its
+# handler are shared by all loggers for the life of the process, while the
+# listener can be stopped and is restarted as needed
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_listener_lock = threading.Lock()
+
+
+class _ListenedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Used to put records on the log queue, starting the listener first if it
+    is not running (e.g. after `stop_log_listener`).
+    """
+
+    def enqueue(self, record: logging.LogRecord):
+        if _queue_listener is None:
+            _start_log_listener()
+        super().enqueue(record)
+
+
+_queue_handler = _ListenedQueueHandler(_log_queue)
+
 
 def get_logger(name: str):
     """
-    Creates and returns a logger with console and file handlers.
+    Creates and returns a logger which puts records on a queue; these are
+    written by console and file handlers in a single listener thread.
     File handler uses settings from the config for rotation, paths, etc.
 
     Returns:
         A configured logger instance
     """
-
-    module_name = os.environ.get(
-        "MODULE_NAME",
-        "filesystem-archaeologist-agent")
-
     # Get the logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
@@ -39,6 +70,38 @@ def get_logger(name: str):
     if logger.handlers:
         return logger
 
+    logger.addHandler(_get_queue_handler())
+
+    return logger
+
+
+def stop_log_listener():
+    """
+    Stops the log listener thread, after it has written all queued records.
+    A new one is started when a record is next logged (by any logger).
+    """
+    global _queue_listener
+    with _queue_listener_lock:
+        listener = _queue_listener
+        _queue_listener = None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+
+# Write out any queued records on exit
+atexit.register(stop_log_listener)
+
+
+def _create_handlers() -> List[logging.Handler]:
+    """
+    Helper function used to create the console and file handlers.
+    """
+    module_name = os.environ.get(
+        "MODULE_NAME",
+        "filesystem-archaeologist-agent")
+
     # Get the appropriate configuration for this module
     logging_config = _setup_logging_config()
 
@@ -47,7 +110,7 @@ def get_logger(name: str):
     formatter = logging.Formatter(log_format)
 
     # Create console handler and set level to WARNING
-    # (to avoid duplicating what the CLI's typer displays to console)
+    # (to avoid duplicating what the CLI displays to console)
     ch = logging.StreamHandler()
     ch.setLevel(logging.WARNING)
     ch.setFormatter(formatter)
@@ -99,11 +162,36 @@ def get_logger(name: str):
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
 
-    # Add handlers to the logger
-    logger.addHandler(ch)
-    logger.addHandler(file_handler)
+    return [ch, file_handler]
 
-    return logger
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """
+    Helper function used to get the queue handler shared by all loggers,
+    starting the listener thread (which owns the console and file handlers)
+    if needed. Logging threads therefore only put records on the queue,
+    rather than contending for the file handler (and its rotation check).
+    """
+    if _queue_listener is None:
+        _start_log_listener()
+    return _queue_handler
+
+
+def _start_log_listener():
+    """
+    Helper function used to start the listener thread, which writes the
+    records on the log queue to the console and file handlers, if it is not
+    already running.
+    """
+    global _queue_listener
+    with _queue_listener_lock:
+        if _queue_listener is None:
+            listener = logging.handlers.QueueListener(
+                _log_queue,
+                *_create_handlers(),
+                respect_handler_level=True)
+            listener.start()
+            _queue_listener = listener
 
 
 def _setup_logging_config() -> Dict[str, Any]:
@@ -2,98 +2,165 @@
 Command-line interface for the Filesystem Archaeologist Agent.
 """
 
+import argparse
 import asyncio
+import logging
+import sys
 import time
 
-import typer
-
-from agentic_fs_archaeologist.app_logger import get_logger
-from agentic_fs_archaeologist.agents import OrchestratorAgent
-from agentic_fs_archaeologist.config import get_settings
-from agentic_fs_archaeologist.hitl import ApprovalGate
-from agentic_fs_archaeologist.memory import (
-    MemoryRetrieval,
-    MemoryStore,
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Optional,
 )
-from agentic_fs_archaeologist.models import (
-    AgentState,
-    MemoryEntry,
-    UserDecision,
+
+from agentic_fs_archaeologist.app_logger import (
+    get_logger,
+    stop_log_listener,
 )
+from agentic_fs_archaeologist.config import get_settings
+from agentic_fs_archaeologist.tools import SharedFSContext
 from agentic_fs_archaeologist.tools.filesystem import FileSystemTools
 
+# The agents, memory, models and HITL modules (and so openai, pydantic and
+# rich) are imported by the commands that use them, so that the other
+# commands (and --help) start quickly
+if TYPE_CHECKING:
+    from agentic_fs_archaeologist.memory import MemoryRetrieval
+    from agentic_fs_archaeologist.models import UserDecision
+
+# Use the uvloop event loop for the scan only if it is installed
+try:
+    import uvloop
+    uvloop_available = True
+except ImportError:
+    uvloop_available = False
+
 
-app = typer.Typer()
 logger = get_logger(__name__)
 
 
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Helper function used to build the command line parser (argparse is
+    used rather than a CLI framework, to keep start-up fast).
+    """
+    parser = argparse.ArgumentParser(prog="fs-archaeologist")
+    commands = parser.add_subparsers(dest="command", required=True,
+                                     metavar="COMMAND")
+
+    p = commands.add_parser(
+        "analyze-growth",
+        help="Analyze directory growth patterns from CSV snapshots.")
+    p.add_argument("--csv-file", default="filesystem_monitor.csv",
+                   help="CSV to analyze")
+    p.set_defaults(func=analyze_growth)
+
+    p = commands.add_parser(
+        "info", help="Show information about the agent.")
+    p.set_defaults(func=info)
+
+    p = commands.add_parser(
+        "monitor", help="Monitor filesystem and save path tracking to CSV.")
+    p.add_argument("--path", default="~", help="Path to monitor")
+    p.add_argument("--csv-file", default="filesystem_monitor.csv",
+                   help="CSV file to save to")
+    p.set_defaults(func=monitor)
+
+    p = commands.add_parser(
+        "scan", help="Scan a directory for cleanup opportunities.")
+    p.add_argument("--path", default=None,
+                   help="Path to scan for cleanup "
+                   "(optional for autonomous mode)")
+    p.add_argument("--model", default=None, help="OpenAI model to use")
+    p.add_argument("--quiet", action=argparse.BooleanOptionalAction,
+                   default=False,
+                   help="Only log progress messages, without echoing them "
+                   "(approval prompts are still shown)")
+    p.set_defaults(func=scan)
+
+    return parser
+
+
 def _echo_banner():
     """
     Helper function
     """
-    typer.echo(f"\n{'='*60}")
-    typer.echo("Filesystem Archaeologist Agent")
-    typer.echo(f"{'='*60}\n")
+    print(f"\n{'='*60}")
+    print("Filesystem Archaeologist Agent")
+    print(f"{'='*60}\n")
 
 
-def _echo_and_log(message: str):
+def _echo_and_log(message: str, quiet: bool = False):
     """
     Helper function
     """
-    typer.echo(message)
+    if not quiet:
+        print(message)
     logger.info(message.replace("\n", ""))
 
 
-@app.command()
-def analyze_growth(
-    csv_file: str = typer.Option("filesystem_monitor.csv",
-                                 help="CSV to analyze"),
-):
+def _echo_and_log_lines(lines: list[str], quiet: bool = False):
+    """
+    Helper function used to echo the lines with a single write, and log
+    them one by one.
+    """
+    if not quiet and lines:
+        print("\n".join(lines))
+    for line in lines:
+        logger.info(line.replace("\n", ""))
+
+
+def analyze_growth(csv_file: str = "filesystem_monitor.csv"):
     """
     Analyze directory growth patterns from CSV snapshots.
     """
     result = FileSystemTools.check_directory_changes(csv_file=csv_file)
     if "error" in result:
-        typer.echo(f"Error: {result['error']}", err=True)
-        raise typer.Exit(1)
+        print(f"Error: {result['error']}", file=sys.stderr)
+        raise SystemExit(1)
 
     num_directories_analysed = result["num_directories_analysed"]
     num_days = result["comparison_period"]["days_between"]
     significant_changes = result["significant_changes"]
-    typer.echo(f"📊 Growth Analysis ({num_days} days)")
-    typer.echo(f"Directories analyzed: {num_directories_analysed}")
-    typer.echo(f"Significant changes: {significant_changes}\n")
+    print(f"📊 Growth Analysis ({num_days} days)")
+    print(f"Directories analyzed: {num_directories_analysed}")
+    print(f"Significant changes: {significant_changes}\n")
 
     for change in result["changes"][:10]:  # Show top 10
         status = "📈" if change["is_increasing"] else "📉"
-        typer.echo(f"{status} {change["directory"]}")
-        typer.echo(f"   {change["growth_mb"]:+.2f}MB "
-                   f"({change["growth_percent"]:+.1f}%)")
-        typer.echo(f"   Current: {change["size_current_mb"]:.2f}MB\n")
+        print(f"{status} {change["directory"]}")
+        print(f"   {change["growth_mb"]:+.2f}MB "
+              f"({change["growth_percent"]:+.1f}%)")
+        print(f"   Current: {change["size_current_mb"]:.2f}MB\n")
 
 
-@app.command()
 def info():
     """
     Helper function used to show information about the agent.
     """
     _echo_banner()
-    typer.echo("  fs-archaeologist scan <path>")
-    typer.echo("\nExample:")
-    typer.echo("  fs-archaeologist scan ~/Downloads")
-    typer.echo("")
+    print("  fs-archaeologist scan <path>")
+    print("\nExample:")
+    print("  fs-archaeologist scan ~/Downloads")
+    print("")
 
 
-def main():
-    app()
+def main(argv: Optional[List[str]] = None):
+    """
+    Entry point, which dispatches to the command selected on the command
+    line.
+    """
+    args = vars(_build_parser().parse_args(argv))
+    args.pop("command")
+    command = args.pop("func")
+    try:
+        command(**args)
+    finally:
+        stop_log_listener()
 
 
-@app.command()
-def monitor(
-    path: str = typer.Option("~", help="Path to monitor"),
-    csv_file: str = typer.Option("filesystem_monitor.csv",
-                                 help="CSV file to save to"),
-):
+def monitor(path: str = "~", csv_file: str = "filesystem_monitor.csv"):
     """
     Monitor filesystem and save path tracking to CSV.
     """
@@ -102,78 +169,66 @@ def monitor(
     logger.info("Starting 'monitor_filesystem' run")
     result = FileSystemTools.monitor_filesystem(path=path, csv_file=csv_file)
     if "error" in result:
-        typer.echo(f"Error: {result['error']}", err=True)
-        raise typer.Exit(1)
+        print(f"Error: {result['error']}", file=sys.stderr)
+        raise SystemExit(1)
     n1, n2 = result["scanned_paths"], result["total_monitored"]
     message = f"Monitored {n1} new paths, total {n2} in {csv_file}"
     num_s = time.time() - start_ts
     num_m = num_s/60
     logger.info(f"Completed 'monitor_filesystem' run in {num_m:.2f} minutes")
     logger.info(message)
-    typer.echo(message)
+    print(message)
 
 
 def _persist_decisions_to_memory(
-        memory: MemoryRetrieval,
-        decisions: list[UserDecision]) -> None:
+        memory: "MemoryRetrieval",
+        decisions: list["UserDecision"],
+        quiet: bool = False) -> None:
     """
-    Helper function used to persist user decisions to memory
-    with detailed logging.
+    Helper function used to persist user decisions to memory in one batch,
+    with detailed logging when debug logging is enabled.
     """
-    _echo_and_log("\nSaving decisions to memory...")
+    from agentic_fs_archaeologist.models import MemoryEntry
 
+    _echo_and_log("\nSaving decisions to memory...", quiet=quiet)
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    entries = []
     for decision in decisions:
-        # Extract pattern
         pattern = memory._extract_pattern(decision.path)
-
-        # Log detailed information about what we're saving
-        logger.info(f"Processing decision save: path={decision.path}, "
-                    f"decision={decision.status.value}")
-        logger.info(f"Extracted pattern: {pattern}")
-
-        # Check if pattern already exists
-        existing = memory.store.find_by_pattern(pattern)
-        if existing:
-            logger.info(f"Existing pattern found: "
-                        f"approval_rate={existing.approval_rate:.2%}, "
-                        f"approval_count={existing.approval_count}, "
-                        f"rejection_count={existing.rejection_count}")
-        else:
-            logger.info("New pattern: will create initial memory entry")
-
-        # Create memory entry
-        entry = MemoryEntry(
+        entries.append(MemoryEntry(
             path_pattern=pattern,
             file_type=decision.classification.file_type,
             directory_type=decision.classification.directory_type,
             user_decision=decision.status,
             confidence=decision.classification.confidence,
-        )
+        ))
+        if debug_enabled:
+            logger.debug("Processing decision save: path=%s, decision=%s, "
+                         "pattern=%s", decision.path, decision.status.value,
+                         pattern)
 
-        # Log the entry structure
-        entry_details = (f"path_pattern={entry.path_pattern}, "
-                         f"file_type={entry.file_type}, "
-                         f"directory_type={entry.directory_type}, "
-                         f"user_decision={entry.user_decision.value}, "
-                         f"confidence={entry.confidence.value}")
-        logger.info(f"Saving MemoryEntry: {entry_details}")
+    memory.store.save_many(entries)
+    logger.info("Saved %d decision(s) to memory", len(entries))
 
-        memory.store.save(entry)
+    if not debug_enabled:
+        return
 
-        # Verify what was actually saved (read back from DB)
-        refreshed = memory.store.find_by_pattern(pattern)
-        if refreshed:
-            final_details = (f"approval_count={refreshed.approval_count}, "
-                             f"rejection_count={refreshed.rejection_count}, "
-                             f"approval_rate={refreshed.approval_rate:.2%}")
-            logger.info(f"After save - memory state: {final_details}")
+    # Verify what was actually saved (read back from DB in one query)
+    patterns = list(dict.fromkeys(entry.path_pattern for entry in entries))
+    saved = memory.store.find_by_patterns(patterns)
+    for pattern, refreshed in saved.items():
+        logger.debug("After save - memory state for %s: "
+                     "approval_count=%d, rejection_count=%d, "
+                     "approval_rate=%.2f%%", pattern,
+                     refreshed.approval_count, refreshed.rejection_count,
+                     refreshed.approval_rate * 100)
 
 
-@app.command()
 def scan(
-    path: str = typer.Option(None, help="Path to scan for cleanup "
-                             "(optional for autonomous mode)"),
-    model: str = typer.Option(None, help="OpenAI model to use"),
+    path: Optional[str] = None,
+    model: Optional[str] = None,
+    quiet: bool = False,
 ):
     """
     Scan a directory for cleanup opportunities.
@@ -183,23 +238,39 @@ def scan(
     settings = get_settings()
     if not settings.openai_api_key:
         error_message = "OPENAI_API_KEY environment variable not set"
-        typer.echo(f"Error: {error_message}", err=True)
-        raise typer.Exit(1)
+        print(f"Error: {error_message}", file=sys.stderr)
+        raise SystemExit(1)
 
     # Run async scan
-    asyncio.run(scan_async(path=path, model=model))
+    if uvloop_available:
+        uvloop.run(scan_async(path=path, model=model, quiet=quiet))
+    else:
+        asyncio.run(scan_async(path=path, model=model, quiet=quiet))
 
 
-async def scan_async(path: str, model: str):
+async def scan_async(path: str, model: str, quiet: bool = False):
     """
     Async scan implementation.
     """
-
-    _echo_banner()
+    from agentic_fs_archaeologist.agents import OrchestratorAgent
+    from agentic_fs_archaeologist.hitl import ApprovalGate
+    from agentic_fs_archaeologist.memory import (
+        MemoryRetrieval,
+        MemoryStore,
+    )
+    from agentic_fs_archaeologist.models import AgentState
+
+    # Start tasks eagerly, so that those completing without suspending
+    # (e.g. cache hits) skip a round trip through the event loop
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    if not quiet:
+        _echo_banner()
     if path:
-        _echo_and_log(f"Scanning: {path}\n")
+        _echo_and_log(f"Scanning: {path}\n", quiet=quiet)
     else:
-        _echo_and_log("Scanning autonomously (no target path specified)\n")
+        _echo_and_log("Scanning autonomously (no target path specified)\n",
+                      quiet=quiet)
 
     # Initialize memory
     store = MemoryStore()
@@ -214,17 +285,17 @@ async def scan_async(path: str, model: str):
         context["target_path"] = path
     state = AgentState(context=context)
 
-    # Execute workflow
-    result = await orchestrator.execute(state)
+    # Execute workflow, sharing one thread pool for filesystem calls
+    async with SharedFSContext():
+        result = await orchestrator.execute(state)
 
     if not result.success:
-        typer.echo(f"Error: {result.error}", err=True)
+        print(f"Error: {result.error}", file=sys.stderr)
         return
 
     # Show reasoning
-    _echo_and_log("Workflow completed!\n")
-    for line in result.reasoning:
-        _echo_and_log(line)
+    _echo_and_log("Workflow completed!\n", quiet=quiet)
+    _echo_and_log_lines(result.reasoning, quiet=quiet)
 
     # Get classifications
     all_classifications = result.data.get("classifications", []) \
@@ -238,11 +309,13 @@ async def scan_async(path: str, model: str):
         c.recommendation in ['delete', 'review']
     ]
 
-    _echo_and_log(f"\nTotal items analyzed: {len(all_classifications)}")
-    _echo_and_log(f"Cleanup opportunities found: {len(classifications)}")
+    _echo_and_log(f"\nTotal items analyzed: {len(all_classifications)}",
+                  quiet=quiet)
+    _echo_and_log(f"Cleanup opportunities found: {len(classifications)}",
+                  quiet=quiet)
 
     if not classifications:
-        _echo_and_log("\nNo cleanup opportunities found.")
+        _echo_and_log("\nNo cleanup opportunities found.", quiet=quiet)
         return
 
     # HITL: Request approval
@@ -250,11 +323,12 @@ async def scan_async(path: str, model: str):
     decisions = approval_gate.request_approval(classifications)
 
     # Save decisions to memory
-    _echo_and_log("\nSaving decisions to memory...")
-    _persist_decisions_to_memory(memory=memory, decisions=decisions)
+    _echo_and_log("\nSaving decisions to memory...", quiet=quiet)
+    _persist_decisions_to_memory(memory=memory, decisions=decisions,
+                                 quiet=quiet)
 
-    _echo_and_log("Done! Decisions saved for future sessions.")
-    _echo_and_log("\nNote: MVP stops here (no actual deletion)")
+    _echo_and_log("Done! Decisions saved for future sessions.", quiet=quiet)
+    _echo_and_log("\nNote: MVP stops here (no actual deletion)", quiet=quiet)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,8 @@
 import os
 
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from dotenv import load_dotenv
 
 from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.exceptions import ConfigurationError
@@ -11,53 +10,101 @@ from agentic_fs_archaeologist.exceptions import ConfigurationError
 
 logger = get_logger(__name__)
 dotenv_file_name = "filesystem-archaeologist-agent.env"
-dotenv_path = Path(__file__).parent.parent.parent / dotenv_file_name
-load_dotenv(dotenv_path)
 
 
-class Settings():
+def _bool_env(key: str, default: bool) -> bool:
+    """
+    Helper function used to parse a boolean environment variable (note that
+    `bool("False")` is True, so the value has to be compared explicitly).
+
+    Args:
+        key: Name of the environment variable
+        default: Value to use when the variable is not set
+
+    Returns:
+        True if the value is one of 1/true/yes/on (case-insensitive)
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _load_dotenv():
     """
-    Application settings.
+    Helper function used to load the .env file into the environment. This
+    is done when the settings are first needed rather than on import, so
+    that commands which do not need them (and --help) start quickly.
+    """
+    from dotenv import load_dotenv
+
+    dotenv_path = Path(__file__).parent.parent.parent / dotenv_file_name
+    load_dotenv(dotenv_path)
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """
+    Application settings (read from the environment when instantiated).
     """
     # OpenAI Configuration
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", default="not-set")
-    model_name: str = os.getenv("MODEL_NAME", default="gpt-4o-mini")
+    openai_api_key: str = field(default_factory=lambda: os.getenv(
+        "OPENAI_API_KEY", default="not-set"))
+    model_name: str = field(default_factory=lambda: os.getenv(
+        "MODEL_NAME", default="gpt-4o-mini"))
 
     # Agent Configuration
-    max_iterations: int = int(os.getenv("MAX_ITERATIONS", default="10"))
-    temperature: float = float(os.getenv("TEMPERATURE", default="0.3"))
+    max_iterations: int = field(default_factory=lambda: int(os.getenv(
+        "MAX_ITERATIONS", default="10")))
+    temperature: float = field(default_factory=lambda: float(os.getenv(
+        "TEMPERATURE", default="0.3")))
+    speculative_thoughts: bool = field(default_factory=lambda: _bool_env(
+        "SPECULATIVE_THOUGHTS", default=False))
 
     # Cleanup Configuration
-    min_size_bytes: int = int(os.getenv("MIN_SIZE_BYTES",
-                              default="1073741824"))  # 1GB
-    min_age_days: int = int(os.getenv("MIN_AGE_DAYS", default="90"))
-    scan_min_size_mb: float = float(os.getenv("SCAN_MIN_SIZE_MB",
-                                              default="25.0"))
-    selection_min_size_mb: float = float(os.getenv("SELECTION_MIN_SIZE_MB",
-                                                   default="5.0"))
+    min_size_bytes: int = field(default_factory=lambda: int(os.getenv(
+        "MIN_SIZE_BYTES", default="1073741824")))  # 1GB
+    min_age_days: int = field(default_factory=lambda: int(os.getenv(
+        "MIN_AGE_DAYS", default="90")))
+    scan_min_size_mb: float = field(default_factory=lambda: float(os.getenv(
+        "SCAN_MIN_SIZE_MB", default="25.0")))
+    selection_min_size_mb: float = field(default_factory=lambda: float(
+        os.getenv("SELECTION_MIN_SIZE_MB", default="5.0")))
+    scan_parallelism: int = field(default_factory=lambda: int(os.getenv(
+        "SCAN_PARALLELISM", default="8")))
+    scan_max_entries: int = field(default_factory=lambda: int(os.getenv(
+        "SCAN_MAX_ENTRIES", default="100000")))
 
     # Safety Configuration
-    enable_reflection: bool = bool(os.getenv("ENABLE_REFLECTION",
-                                             default="True"))
+    enable_reflection: bool = field(default_factory=lambda: _bool_env(
+        "ENABLE_REFLECTION", default=True))
 
     # Memory Configuration
-    enable_memory: bool = bool(os.getenv("ENABLE_MEMORY", default="True"))
-    memory_db_path: Path = Path(os.getenv("MEMORY_DB_PATH",
-                                          default="memory.db"))
+    enable_memory: bool = field(default_factory=lambda: _bool_env(
+        "ENABLE_MEMORY", default=True))
+    memory_db_path: Path = field(default_factory=lambda: Path(os.getenv(
+        "MEMORY_DB_PATH", default="memory.db")))
 
     # Cache Configuration
-    classifier_cache_ttl: int = int(os.getenv("CLASSIFIER_CACHE_TTL",
-                                              default="3600"))
+    classifier_cache_ttl: int = field(default_factory=lambda: int(os.getenv(
+        "CLASSIFIER_CACHE_TTL", default="3600")))
+    thought_cache_ttl: int = field(default_factory=lambda: int(os.getenv(
+        "THOUGHT_CACHE_TTL", default="3600")))
+    reflection_cache_ttl: int = field(default_factory=lambda: int(os.getenv(
+        "REFLECTION_CACHE_TTL", default="3600")))
+    stat_cache_ttl: int = field(default_factory=lambda: int(os.getenv(
+        "STAT_CACHE_TTL", default="300")))
 
     # Paths
-    data_dir: Path = Path(os.getenv("DATA_DIR", default="."))
+    data_dir: Path = field(default_factory=lambda: Path(os.getenv(
+        "DATA_DIR", default=".")))
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    def __post_init__(self):
         # Create directories if they do not exist
         try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-            self.memory_db_path.parent.mkdir(parents=True, exist_ok=True)
+            for dir_path in (self.data_dir, self.memory_db_path.parent):
+                if not dir_path.is_dir():
+                    dir_path.mkdir(parents=True, exist_ok=True)
         except PermissionError as e:
             # Log the error and raise a more descriptive exception
             error_message = f"Permission denied when creating directories: {e}"
@@ -69,23 +116,17 @@ class Settings():
             raise ConfigurationError(error_message)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get global settings instance.
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    _load_dotenv()
+    return Settings()
 
 
 def reset_settings():
     """
     Reset settings (mainly for testing).
     """
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
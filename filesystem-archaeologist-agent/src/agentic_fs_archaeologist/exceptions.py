@@ -12,21 +12,21 @@ class ConfigurationError(BaseExceptionFSArchaeologist):
     pass
 
 
-class MemoryError(BaseExceptionFSArchaeologist):
+class MemorySystemError(BaseExceptionFSArchaeologist):
     """
     Base exception for memory system errors.
     """
     pass
 
 
-class MemoryStorageError(MemoryError):
+class MemoryStorageError(MemorySystemError):
     """
     Used to indicate error when an agent attempts to store to memory.
     """
     pass
 
 
-class MemoryRetrievalError(MemoryError):
+class MemoryRetrievalError(MemorySystemError):
     """
     Used to indicate error when an agent attempts to retrieve from memory.
     """
@@ -1,4 +1,10 @@
-from typing import List
+import logging
+import sys
+
+from typing import (
+    List,
+    Set,
+)
 
 from rich.console import Console
 from rich.table import Table
@@ -8,6 +14,7 @@ from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.models import (
     ApprovalStatus,
     Classification,
+    DeletionConfidence,
     UserDecision,
 )
 from agentic_fs_archaeologist.utils.file_utils import format_file_size
@@ -21,26 +28,13 @@ class ApprovalGate:
     Simple CLI-based approval gate.
     """
 
+    # Above this many uncertain items (or without an interactive terminal),
+    # they are shown in one table and approved with a single prompt
+    MAX_INDIVIDUAL_REVIEWS = 5
+
     def __init__(self):
         self.console = Console()
 
-    def _construct_decorator(self) -> str:
-        decorator_str = "\n".join([
-            "\n" + "="*80,
-            "APPROVAL REQUIRED",
-            "="*80
-        ])
-        return decorator_str
-
-    def _construct_descriptor_for_uncertainty(self, c: Classification) -> str:
-        desc_str = "\n".join([
-            "-"*60,
-            f"  Path: {c.path}",
-            f"  Size: {format_file_size(c.estimated_savings_bytes)}",
-            f"  Reasoning: {c.reasoning[:100]}..."
-        ])
-        return desc_str
-
     def _display_approval_header(self):
         """
         Helper function used to display the approval required header.
@@ -75,16 +69,17 @@ class ApprovalGate:
         table.add_column("File Path", style="cyan")
         table.add_column("Size", justify="right", style="yellow")
 
-        for c in classifications[:max_rows]:
-            size_str = format_file_size(c.estimated_savings_bytes)
-            table.add_row(str(c.path), f"{size_str}")
-            logger.info(f"Item: {str(c.path)} "
-                        f"(size_bytes={c.estimated_savings_bytes}, "
-                        f"display={size_str})")
+        rows = [(str(c.path), format_file_size(c.estimated_savings_bytes))
+                for c in classifications[:max_rows]]
+        for path_str, size_str in rows:
+            table.add_row(path_str, size_str)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Items:\n%s", "\n".join(
+                f"{path_str} ({size_str})" for path_str, size_str in rows))
 
         if count > max_rows:
-            table.add_row(f"... and {count - 5} more", "")
-            logger.info(f"... and {count - 5} more items")
+            table.add_row(f"... and {count - max_rows} more", "")
+            logger.info("... and %d more items", count - max_rows)
 
         self.console.print(table)
 
@@ -101,6 +96,41 @@ class ApprovalGate:
             for c in classifications
         ]
 
+    def _display_uncertain_batch_approval(
+            self,
+            classifications: List[Classification]) -> List[UserDecision]:
+        """
+        Helper function used to display all uncertain items in one table,
+        and read the indices of those to approve with a single prompt.
+        """
+        count = len(classifications)
+        logger.info(f"Reviewing {count} uncertain items in one batch")
+
+        table = Table(title=f"[red]{count} UNCERTAIN items[/red]")
+        table.add_column("#", justify="right")
+        table.add_column("File Path", style="cyan")
+        table.add_column("Size", justify="right", style="yellow")
+        table.add_column("Reasoning")
+        for i, c in enumerate(classifications, 1):
+            table.add_row(str(i), str(c.path),
+                          format_file_size(c.estimated_savings_bytes),
+                          f"{c.reasoning[:100]}...")
+        self.console.print(table)
+
+        self.console.print("\n[bold]Enter space-separated indices to "
+                           "approve (or 'all'/'none'):[/bold] ", end="")
+        approved = self._parse_approved_indices(input(), count)
+        logger.info(f"User approved {len(approved)}/{count} uncertain items")
+
+        return [
+            UserDecision(
+                path=c.path,
+                classification=c,
+                status=ApprovalStatus.APPROVED if i in approved
+                else ApprovalStatus.REJECTED)
+            for i, c in enumerate(classifications, 1)
+        ]
+
     def _display_uncertain_item_approval(
             self,
             classification: Classification,
@@ -148,6 +178,23 @@ class ApprovalGate:
         )
         self.console.print(summary_panel)
 
+    def _parse_approved_indices(self, response: str, count: int) -> Set[int]:
+        """
+        Helper function used to parse the (1-based) indices approved in
+        response to the batch prompt. Invalid indices are ignored.
+        """
+        response = response.strip().lower()
+        if response == "all":
+            return set(range(1, count + 1))
+
+        approved = set()
+        for token in response.replace(",", " ").split():
+            if token.isdecimal() and 1 <= int(token) <= count:
+                approved.add(int(token))
+            elif token != "none":
+                logger.warning(f"Ignoring invalid index: {token}")
+        return approved
+
     def request_approval(
             self,
             classifications: List[Classification]) -> List[UserDecision]:
@@ -160,14 +207,19 @@ class ApprovalGate:
         Returns:
             List of UserDecision objects
         """
-        decisions = []
-
-        # Group by confidence
-        safe = [c for c in classifications if c.confidence.value == "safe"]
-        likely_safe = [c for c in classifications
-                       if c.confidence.value == "likely_safe"]
-        uncertain = [c for c in classifications
-                     if c.confidence.value == "uncertain"]
+        # Group by confidence (in a single pass)
+        buckets = {
+            DeletionConfidence.SAFE: [],
+            DeletionConfidence.LIKELY_SAFE: [],
+            DeletionConfidence.UNCERTAIN: [],
+        }
+        for c in classifications:
+            bucket = buckets.get(c.confidence)
+            if bucket is not None:
+                bucket.append(c)
+        safe = buckets[DeletionConfidence.SAFE]
+        likely_safe = buckets[DeletionConfidence.LIKELY_SAFE]
+        uncertain = buckets[DeletionConfidence.UNCERTAIN]
 
         # Log overview of the files for which approval is required
         logger.info(f"Approval required for {len(classifications)} items "
@@ -177,28 +229,44 @@ class ApprovalGate:
         # Display header
         self._display_approval_header()
 
-        # Handle each group
+        # Handle each group, counting approvals as decisions are made
         decisions = []
-        decisions.extend(self._display_batch_approval(
-            classifications=safe,
-            title="SAFE items (high confidence)",
-            border_color="green",
-            log_message="Requesting batch approval for safe"
-        ))
-        decisions.extend(self._display_batch_approval(
-            classifications=likely_safe,
-            title="LIKELY SAFE items",
-            border_color="orange",
-            log_message="Requesting batch approval for likely safe"
-        ))
-
-        # Handle uncertain items individually
-        for i, c in enumerate(uncertain, 1):
-            decisions.append(self._display_uncertain_item_approval(c, i))
+        approved = 0
+        for group, title, border_color, log_message in (
+                (safe, "SAFE items (high confidence)", "green",
+                 "Requesting batch approval for safe"),
+                (likely_safe, "LIKELY SAFE items", "orange",
+                 "Requesting batch approval for likely safe")):
+            batch = self._display_batch_approval(
+                classifications=group,
+                title=title,
+                border_color=border_color,
+                log_message=log_message
+            )
+            # All decisions in a batch share the same status
+            if batch and batch[0].status == ApprovalStatus.APPROVED:
+                approved += len(batch)
+            decisions.extend(batch)
+
+        # Handle uncertain items individually, unless there are too many
+        # (or no one at a terminal to answer each prompt)
+        if (len(uncertain) <= self.MAX_INDIVIDUAL_REVIEWS
+                and sys.stdin.isatty()):
+            uncertain_decisions = [
+                self._display_uncertain_item_approval(c, i)
+                for i, c in enumerate(uncertain, 1)
+            ]
+        elif uncertain:
+            uncertain_decisions = \
+                self._display_uncertain_batch_approval(uncertain)
+        else:
+            uncertain_decisions = []
+        for decision in uncertain_decisions:
+            if decision.status == ApprovalStatus.APPROVED:
+                approved += 1
+        decisions.extend(uncertain_decisions)
 
         # Display summary
-        approved = sum(1 for d in decisions
-                       if d.status == ApprovalStatus.APPROVED)
         self._display_summary(approved, len(decisions))
 
         return decisions
@@ -1,5 +1,9 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
 from agentic_fs_archaeologist.memory.store import MemoryStore
 from agentic_fs_archaeologist.models import MemoryEntry
@@ -10,10 +14,17 @@ class MemoryRetrieval:
     Used to retrieve and match memory entries.
     """
 
+    # Directory names which are stored as-is (e.g. */node_modules)
+    _BUILD_DIRS = frozenset({"build", "dist", "target", ".next", "out"})
+    _VCS_DIRS = frozenset({"node_modules", ".git", ".venv", "venv", "env"})
+    _NAMED_DIR_PATTERNS = {name: f"*/{name}"
+                           for name in _VCS_DIRS | _BUILD_DIRS}
+
     def __init__(self, store: MemoryStore):
         self.store = store or MemoryStore()
 
-    def _extract_pattern(self, path: Path) -> str:
+    @staticmethod
+    def _extract_pattern(path: Path) -> str:
         """
         Helper function used to extract a pattern from a path for storage.
 
@@ -28,37 +39,63 @@ class MemoryRetrieval:
         Returns:
             Pattern string
         """
-        path_obj = Path(path)
+        path_str = str(path)
+        pattern = MemoryRetrieval._extract_pattern_cached(path_str)
+        if pattern is not None:
+            return pattern
+
+        # Not decided by the path alone, so check (each time, as it may
+        # change) whether it is a file (without a suffix)
+        path_obj = Path(path_str)
+        return "*" if path_obj.is_file() else f"*/{path_obj.name.lower()}"
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _extract_pattern_cached(path_str: str) -> Optional[str]:
+        """
+        Helper function used to extract the pattern for a path string from
+        the path alone (see `_extract_pattern`), memoised since batch
+        workloads see the same paths repeatedly. The filesystem is not
+        checked, so that results do not go stale.
+
+        Args:
+            path_str: Path to extract pattern from
+
+        Returns:
+            Pattern string, or None if it depends on whether the path is a
+            file
+        """
+        path_obj = Path(path_str)
 
         # Handle common directory patterns
         name = path_obj.name.lower()
 
-        if name in ["node_modules", ".git", ".venv", "venv", "env"]:
-            return f"*/{name}"
+        named_pattern = MemoryRetrieval._NAMED_DIR_PATTERNS.get(name)
+        if named_pattern is not None:
+            return named_pattern
 
         if "cache" in name:
             return "*/cache/*"
 
-        if name in ["build", "dist", "target", ".next", "out"]:
-            return f"*/{name}"
-
         # Handle file extensions
-        if path_obj.is_file() or path_obj.suffix:
-            return f"*{path_obj.suffix}"
+        suffix = path_obj.suffix
+        if suffix:
+            return f"*{suffix}"
 
-        # Default: use full name
-        return f"*/{name}"
+        # Otherwise, "*" for a file and "*/<name>" for anything else
+        return None
 
-    async def find_similar(
+    def find_similar(
             self,
             path: Path,
             limit: int = 5) -> List[MemoryEntry]:
         """
         Helper function used to find similar entries for a given path.
 
-        This function uses the following matching strategies:
+        This function uses the following matching strategies (evaluated by
+        the store in a single query):
         1. Exact pattern match
-        2. Extension match
+        2. Extension match (for paths with a suffix)
         3. Parent directory match
         4. Name pattern match
 
@@ -69,45 +106,13 @@ class MemoryRetrieval:
         Returns:
             List of similar MemoryEntry objects, sorted by relevance
         """
-        similar = []
-        seen_patterns = set()
-
-        # Strategy 1: Exact pattern match
-        pattern = self._extract_pattern(path)
-        exact = self.store.find_by_pattern(pattern)
-        if exact and pattern not in seen_patterns:
-            similar.append((exact, 1.0))  # Perfect match
-            seen_patterns.add(pattern)
-
-        # Strategy 2: Extension match (for files)
-        if path.is_file() or not Path(path).exists():
-            ext = Path(path).suffix
-            if ext:
-                entries = self.store.search(ext, limit=limit * 2)
-                for entry in entries:
-                    if entry.path_pattern not in seen_patterns:
-                        similar.append((entry, 0.8))  # Good match
-                        seen_patterns.add(entry.path_pattern)
-
-        # Strategy 3: Parent directory pattern
-        parent_name = Path(path).parent.name
-        if parent_name:
-            entries = self.store.search(parent_name, limit=limit * 2)
-            for entry in entries:
-                if entry.path_pattern not in seen_patterns:
-                    similar.append((entry, 0.6))  # Moderate match
-                    seen_patterns.add(entry.path_pattern)
-
-        # Strategy 4: Name pattern
-        name = Path(path).name
-        entries = self.store.search(name, limit=limit * 2)
-        for entry in entries:
-            if entry.path_pattern not in seen_patterns:
-                similar.append((entry, 0.4))  # Weak match
-                seen_patterns.add(entry.path_pattern)
-
-        # Sort by relevance score (descending)
-        similar.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top results without scores
-        return [entry for entry, score in similar[:limit]]
+        path_obj = Path(path)
+        pattern = self._extract_pattern(path_obj)
+
+        # Extension match is decided lexically, to avoid a stat call
+        return self.store.find_ranked(
+            exact_pattern=pattern,
+            ext=path_obj.suffix or None,
+            parent=path_obj.parent.name or None,
+            name=path_obj.name,
+            limit=limit)
@@ -1,15 +1,28 @@
 import json
 
+import queue
 import sqlite3
+import threading
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
     List,
     Optional,
+    Tuple,
 )
 
+from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.config import get_settings
+from agentic_fs_archaeologist.exceptions import MemoryRetrievalError
 from agentic_fs_archaeologist.models import (
     ApprovalStatus,
     DeletionConfidence,
@@ -21,11 +34,288 @@ from agentic_fs_archaeologist.models import (
 )
 
 
+# Store the reflection outcome contexts with msgpack only if it is installed
+# (smaller, and faster to encode and decode, than JSON)
+try:
+    import msgpack
+    msgpack_available = True
+except ImportError:
+    msgpack_available = False
+
+
+logger = get_logger(__name__)
+
+
 class MemoryStore:
     """
     Used to implement a SQLite-based memory storage.
     """
 
+    MAX_QUERY_PARAMS = 500
+    MAX_READERS = 4
+    CACHED_STATEMENTS = 256
+    FETCH_BATCH_SIZE = 256
+    # Maximum number of lookup results (`find_by_pattern`, `find_ranked`)
+    # kept in memory
+    MAX_CACHED_LOOKUPS = 4096
+    # Number of commits after which `PRAGMA optimize` is run (so that the
+    # query planner's statistics keep up as the tables grow)
+    OPTIMIZE_EVERY_COMMITS = 1000
+
+    # Used to convert the stored values back to enum members with a dict
+    # lookup (rather than calling the enum class, for every row)
+    _APPROVAL_STATUSES = {s.value: s for s in ApprovalStatus}
+    _CONFIDENCES = {c.value: c for c in DeletionConfidence}
+    _DIRECTORY_TYPES = {t.value: t for t in DirectoryType}
+    _FILE_TYPES = {t.value: t for t in FileType}
+
+    # Applied to every connection (WAL mode is persistent, so it is only set
+    # when initialising the database): with WAL, `synchronous=NORMAL` only
+    # syncs at checkpoints, and readers do not block the writer
+    _CONNECTION_PRAGMAS = """
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA cache_size=-20000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+    """
+
+    # Statements are kept as class constants so that the text (which keys
+    # each connection's prepared statement cache) is identical across calls,
+    # and shared where queries are, e.g. by `save` and `save_many`
+    _FIND_BY_PATTERN_SQL = """
+        SELECT
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at
+        FROM
+            memory_entries
+        WHERE
+            path_pattern = ?
+    """
+    _GET_ALL_SQL = """
+        SELECT
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at
+        FROM
+            memory_entries
+        ORDER BY
+            updated_at DESC
+        LIMIT ?
+    """
+    _GET_REFLECTION_HISTORY_SQL = """
+        SELECT
+            path,
+            decision,
+            reasoning,
+            accuracy_confirmed,
+            confidence_before,
+            confidence_after,
+            context,
+            timestamp
+        FROM
+            reflection_history
+        WHERE
+            path LIKE ?
+        ORDER BY
+            timestamp DESC
+        LIMIT ?
+    """
+    _INSERT_REFLECTION_SQL = """
+        INSERT INTO reflection_history (
+            path,
+            decision,
+            reasoning,
+            accuracy_confirmed,
+            confidence_before,
+            confidence_after,
+            context,
+            timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _REFLECTION_ERROR_PATTERNS_SQL = """
+        SELECT decision,
+            COUNT(*) as total,
+            AVG(CASE WHEN accuracy_confirmed = 1 THEN 1.0 ELSE 0.0 END)
+            as acc_rate
+        FROM reflection_history
+        WHERE accuracy_confirmed IS NOT NULL
+        GROUP BY decision
+        HAVING acc_rate < 0.8 AND total >= 3
+        ORDER BY total DESC
+        LIMIT 5
+    """
+    _REFLECTION_TOTALS_SQL = """
+        SELECT
+            COUNT(*) as total,
+            COUNT(accuracy_confirmed) as total_confirmed,
+            SUM(CASE WHEN accuracy_confirmed = 1 THEN 1 ELSE 0 END)
+            as correct
+        FROM reflection_history
+    """
+    # As above, but matching through the trigram full-text indexes (which
+    # support LIKE, so the results are the same)
+    _GET_REFLECTION_HISTORY_FTS_SQL = """
+        SELECT
+            r.path,
+            r.decision,
+            r.reasoning,
+            r.accuracy_confirmed,
+            r.confidence_before,
+            r.confidence_after,
+            r.context,
+            r.timestamp
+        FROM
+            reflection_history_fts f
+            JOIN reflection_history r ON r.id = f.rowid
+        WHERE
+            f.path LIKE ?
+        ORDER BY
+            r.timestamp DESC
+        LIMIT ?
+    """
+    _SEARCH_FTS_SQL = """
+        SELECT
+            m.path_pattern,
+            m.file_type,
+            m.directory_type,
+            m.user_decision,
+            m.confidence,
+            m.approval_count,
+            m.rejection_count,
+            m.created_at,
+            m.updated_at
+        FROM
+            memory_entries_fts f
+            JOIN memory_entries m ON m.id = f.rowid
+        WHERE
+            f.path_pattern LIKE ?
+            LIMIT ?
+    """
+    # Prefix matches, written as a range on the column (which is what SQLite
+    # rewrites `LIKE 'prefix%'` to, when it can) so the index is used
+    _GET_REFLECTION_HISTORY_PREFIX_SQL = """
+        SELECT
+            path,
+            decision,
+            reasoning,
+            accuracy_confirmed,
+            confidence_before,
+            confidence_after,
+            context,
+            timestamp
+        FROM
+            reflection_history
+        WHERE
+            path >= ? AND path < ?
+        ORDER BY
+            timestamp DESC
+        LIMIT ?
+    """
+    _SEARCH_PREFIX_SQL = """
+        SELECT
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at
+        FROM
+            memory_entries
+        WHERE
+            path_pattern >= ? AND path_pattern < ?
+        LIMIT ?
+    """
+    _SEARCH_SQL = """
+        SELECT
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at
+        FROM
+            memory_entries
+        WHERE
+            path_pattern LIKE ?
+            LIMIT ?
+    """
+    # Inserts an entry, or (if its pattern is already stored) records the
+    # new decision, incrementing the count for it
+    _UPSERT_ENTRY_SQL = """
+        INSERT INTO memory_entries (
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(path_pattern) DO UPDATE SET
+            user_decision = excluded.user_decision,
+            confidence = excluded.confidence,
+            approval_count = approval_count + excluded.approval_count,
+            rejection_count = rejection_count + excluded.rejection_count,
+            updated_at = excluded.updated_at
+    """
+    _UPDATE_REFLECTION_ACCURACY_SQL = """
+        UPDATE reflection_history
+        SET accuracy_confirmed = ?
+        WHERE path = ?
+    """
+
+    # Scores each entry by the strongest way it matches a path (exact
+    # pattern, extension, parent directory name, name); a NULL parameter
+    # disables that strategy
+    _FIND_RANKED_SQL = """
+        SELECT
+            path_pattern,
+            file_type,
+            directory_type,
+            user_decision,
+            confidence,
+            approval_count,
+            rejection_count,
+            created_at,
+            updated_at,
+            CASE
+                WHEN path_pattern = ? THEN 1.0
+                WHEN path_pattern LIKE ? THEN 0.8
+                WHEN path_pattern LIKE ? THEN 0.6
+                WHEN path_pattern LIKE ? THEN 0.4
+            END AS score
+        FROM
+            memory_entries
+        WHERE
+            score IS NOT NULL
+        ORDER BY
+            score DESC,
+            id
+        LIMIT ?
+    """
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize the SQLite-based memory  store.
@@ -38,8 +328,185 @@ class MemoryStore:
             db_path = settings.memory_db_path
 
         self.db_path = db_path
+        # One read-write connection, used by one thread at a time, and a
+        # pool of read-only connections (created as needed), which WAL
+        # mode lets read while the writer is writing
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._readers: queue.Queue = queue.Queue()
+        self._readers_lock = threading.Lock()
+        self._num_readers = 0
+        # Incremented by `_optimize`; pooled readers (held as tuples of the
+        # generation they were opened in, and the connection) from earlier
+        # generations are reopened, to pick up the updated statistics
+        self._readers_generation = 0
+        self._commits_since_optimize = 0
+        # Least recently used lookup results, keyed by the lookup (and its
+        # arguments); the generation is incremented whenever the cache is
+        # cleared, so that results read before then are not added to it
+        self._lookup_cache: OrderedDict = OrderedDict()
+        self._lookup_cache_lock = threading.Lock()
+        self._lookup_cache_generation = 0
+        # Set by `_init_db`, and updated by `_check_data_version`
+        self._data_version: Optional[int] = None
+        # Set by `_init_db` (FTS5 with the trigram tokenizer needs
+        # SQLite 3.34+)
+        self.fts_available = False
         self._init_db()
 
+    def __del__(self):
+        self.close()
+
+    @contextmanager
+    def _borrow_reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Helper function used to check out a read-only connection from the
+        pool (opening one if fewer than `MAX_READERS` exist, otherwise
+        waiting for one to be returned).
+
+        Yields:
+            sqlite3.Connection
+        """
+        try:
+            generation, conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                can_open = self._num_readers < self.MAX_READERS
+                if can_open:
+                    self._num_readers += 1
+            if can_open:
+                generation = self._readers_generation
+                conn = self._connect(read_only=True)
+            else:
+                generation, conn = self._readers.get()
+        if generation != self._readers_generation:
+            conn.close()
+            generation = self._readers_generation
+            conn = self._connect(read_only=True)
+        try:
+            yield conn
+        finally:
+            self._readers.put((generation, conn))
+
+    def _cached_lookup(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Helper function used to get the result of a lookup from the cache,
+        fetching (and caching) it if needed.
+
+        Args:
+            key: The lookup, and its arguments
+            fetch: Function used to fetch the result from the database
+
+        Returns:
+            The result of the lookup
+        """
+        # (Reading the data version is cheap, as it is only a counter)
+        self._check_data_version()
+
+        with self._lookup_cache_lock:
+            if key in self._lookup_cache:
+                self._lookup_cache.move_to_end(key)
+                return self._lookup_cache[key]
+            generation = self._lookup_cache_generation
+
+        result = fetch()
+
+        with self._lookup_cache_lock:
+            if generation == self._lookup_cache_generation:
+                self._lookup_cache[key] = result
+                if len(self._lookup_cache) > self.MAX_CACHED_LOOKUPS:
+                    self._lookup_cache.popitem(last=False)
+        return result
+
+    def _check_data_version(self):
+        """
+        Helper function used to clear the lookup cache if the database has
+        been changed by another connection (e.g. another store, or another
+        process) since the last check, as shown by `PRAGMA data_version`.
+        """
+        with self._write_lock:
+            data_version = self._read_data_version()
+            changed = data_version != self._data_version
+            self._data_version = data_version
+            if changed:
+                self._clear_lookup_cache()
+
+    def _clear_lookup_cache(self):
+        """
+        Helper function used to clear the lookup cache (after the memory
+        entries have changed).
+        """
+        with self._lookup_cache_lock:
+            self._lookup_cache.clear()
+            self._lookup_cache_generation += 1
+
+    def close(self):
+        """
+        Helper function used to close the connections to the database,
+        running `PRAGMA optimize` first (as SQLite recommends).
+        """
+        writer = getattr(self, "_writer", None)
+        if writer is not None:
+            self._writer = None
+            try:
+                writer.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            writer.close()
+        readers = getattr(self, "_readers", None)
+        while readers is not None and not readers.empty():
+            readers.get_nowait()[1].close()
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Helper function used to open a connection to the database, with the
+        connection-level PRAGMAs applied.
+
+        Args:
+            read_only: Whether to open the database in read-only mode
+
+        Returns:
+            sqlite3.Connection
+        """
+        if read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False,
+                cached_statements=self.CACHED_STATEMENTS)
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            # Transactions are begun explicitly (see `_transaction`)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False,
+                isolation_level=None,
+                cached_statements=self.CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self._CONNECTION_PRAGMAS)
+        return conn
+
+    def _entry_to_row(self, entry: MemoryEntry) -> Tuple:
+        """
+        Helper function used to convert a `MemoryEntry` into the parameters
+        of `_UPSERT_ENTRY_SQL`.
+
+        Args:
+            entry: MemoryEntry to convert
+
+        Returns:
+            Tuple of column values
+        """
+        return (
+            entry.path_pattern,
+            entry.file_type.value if entry.file_type else None,
+            entry.directory_type.value if entry.directory_type else None,
+            entry.user_decision.value,
+            entry.confidence.value,
+            1 if entry.user_decision == ApprovalStatus.APPROVED else 0,
+            1 if entry.user_decision == ApprovalStatus.REJECTED else 0,
+            entry.created_at.isoformat(),
+            entry.updated_at.isoformat()
+        )
+
     def find_by_pattern(self, pattern: str) -> Optional[MemoryEntry]:
         """
         Helper function used to find entry by exact pattern match.
@@ -50,32 +517,109 @@ class MemoryStore:
         Returns:
             MemoryEntry if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT
-                path_pattern,
-                file_type,
-                directory_type,
-                user_decision,
-                confidence,
-                approval_count,
-                rejection_count,
-                created_at,
-                updated_at
-            FROM
-                memory_entries
-            WHERE
-                path_pattern = ?
-        """, (pattern,))
-        row = cursor.fetchone()
-        conn.close()
+        return self._cached_lookup(
+            ("pattern", pattern),
+            lambda: self._find_by_pattern(pattern))
+
+    def _find_by_pattern(self, pattern: str) -> Optional[MemoryEntry]:
+        """
+        Helper function used to query the entry for a pattern (see
+        `find_by_pattern`).
+        """
+        with self._read() as cursor:
+            cursor.execute(self._FIND_BY_PATTERN_SQL, (pattern,))
+            row = cursor.fetchone()
 
         if row:
             return self._row_to_entry(row)
         return None
 
+    def find_by_patterns(self, patterns: List[str]) -> Dict[str, MemoryEntry]:
+        """
+        Helper function used to find entries for several exact patterns
+        with a single query per batch of patterns.
+
+        Args:
+            patterns: Path patterns to find
+
+        Returns:
+            Dict mapping each pattern found to its MemoryEntry
+        """
+        found = {}
+        with self._read() as cursor:
+            # Stay below SQLite's limit on the number of bound parameters
+            for i in range(0, len(patterns), self.MAX_QUERY_PARAMS):
+                batch = patterns[i:i + self.MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                cursor.execute(f"""
+                    SELECT
+                        path_pattern,
+                        file_type,
+                        directory_type,
+                        user_decision,
+                        confidence,
+                        approval_count,
+                        rejection_count,
+                        created_at,
+                        updated_at
+                    FROM
+                        memory_entries
+                    WHERE
+                        path_pattern IN ({placeholders})
+                """, batch)
+                for row in cursor.fetchall():
+                    found[row["path_pattern"]] = self._row_to_entry(row)
+
+        return found
+
+    def find_ranked(
+            self,
+            exact_pattern: str,
+            ext: Optional[str],
+            parent: Optional[str],
+            name: Optional[str],
+            limit: int = 5) -> List[MemoryEntry]:
+        """
+        Helper function used to find entries matching a path in a single
+        query, ranked by how closely they match.
+
+        Args:
+            exact_pattern: Pattern to match exactly
+            ext: Extension to match (None to skip)
+            parent: Parent directory name to match (None to skip)
+            name: Name to match (None to skip)
+            limit: Maximum number of results
+
+        Returns:
+            List of MemoryEntry objects, sorted by relevance
+        """
+        key = ("ranked", exact_pattern, ext, parent, name, limit)
+        return list(self._cached_lookup(key, lambda: self._find_ranked(
+            exact_pattern, ext, parent, name, limit)))
+
+    def _find_ranked(
+            self,
+            exact_pattern: str,
+            ext: Optional[str],
+            parent: Optional[str],
+            name: Optional[str],
+            limit: int) -> List[MemoryEntry]:
+        """
+        Helper function used to query the entries matching a path (see
+        `find_ranked`).
+        """
+        with self._read() as cursor:
+            cursor.execute(self._FIND_RANKED_SQL, (
+                exact_pattern,
+                f"%{ext}%" if ext is not None else None,
+                f"%{parent}%" if parent is not None else None,
+                f"%{name}%" if name is not None else None,
+                limit
+            ))
+            rows = cursor.fetchall()
+
+        return [self._row_to_entry(row) for row in rows]
+
     def _generate_improvement_suggestions(
             self,
             accuracy_rate: float,
@@ -117,18 +661,7 @@ class MemoryStore:
         Returns:
             List of MemoryEntry objects
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT * FROM memory_entries ORDER BY updated_at DESC LIMIT ?",
-            (limit,)
-        )
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [self._row_to_entry(row) for row in rows]
+        return list(self.iter_all(limit=limit))
 
     def get_reflection_history(
             self,
@@ -144,46 +677,40 @@ class MemoryStore:
         Returns:
             List of ReflectionOutcome objects
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._read() as cursor:
+            sql = self._GET_REFLECTION_HISTORY_FTS_SQL \
+                if self.fts_available else self._GET_REFLECTION_HISTORY_SQL
+            cursor.execute(sql, (f"%{path_pattern}%", limit))
+            rows: List[sqlite3.Row] = cursor.fetchall()
 
-        cursor.execute("""
-            SELECT
-                path,
-                decision,
-                reasoning,
-                accuracy_confirmed,
-                confidence_before,
-                confidence_after,
-                context,
-                timestamp
-            FROM
-                reflection_history
-            WHERE
-                path LIKE ?
-            ORDER BY
-                timestamp DESC
-            LIMIT ?
-        """, (f"%{path_pattern}%", limit))
-
-        rows: List[sqlite3.Row] = cursor.fetchall()
-        conn.close()
-
-        outcomes = []
-        for row in rows:
-            outcomes.append(ReflectionOutcome(
-                path=Path(row["path"]),
-                decision=row["decision"],
-                reasoning=row["reasoning"],
-                accuracy_confirmed=row["accuracy_confirmed"],
-                confidence_before=DeletionConfidence(row["confidence_before"]),
-                confidence_after=DeletionConfidence(row["confidence_after"]),
-                context=json.loads(row["context"]) if row["context"] else {},
-                timestamp=datetime.fromisoformat(row["timestamp"])
-            ))
+        return [self._row_to_reflection_outcome(row) for row in rows]
 
-        return outcomes
+    def get_reflection_history_by_prefix(
+            self,
+            path_prefix: str,
+            limit: int = 10) -> List[ReflectionOutcome]:
+        """
+        Helper function used to get the reflection history for the paths
+        starting with a prefix (e.g. a directory). Unlike
+        `get_reflection_history`, this uses the index on the path, and is
+        case-sensitive.
+
+        Args:
+            path_prefix: Path prefix to search for
+            limit: Maximum number of results
+
+        Returns:
+            List of ReflectionOutcome objects
+        """
+        if not path_prefix:
+            return self.get_reflection_history(path_prefix, limit=limit)
+
+        with self._read() as cursor:
+            cursor.execute(self._GET_REFLECTION_HISTORY_PREFIX_SQL,
+                           (*self._prefix_range(path_prefix), limit))
+            rows: List[sqlite3.Row] = cursor.fetchall()
+
+        return [self._row_to_reflection_outcome(row) for row in rows]
 
     def get_reflection_metrics(self) -> ReflectionMetrics:
         """
@@ -193,46 +720,22 @@ class MemoryStore:
         Returns:
             ReflectionMetrics object
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get total reflections
-        cursor.execute("SELECT COUNT(*) FROM reflection_history")
-        total_reflections = cursor.fetchone()[0]
-
-        # Get accuracy rate for confirmed outcomes
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_confirmed,
-                SUM(CASE WHEN accuracy_confirmed = 1 THEN 1 ELSE 0 END)
-                as correct
-            FROM reflection_history
-            WHERE accuracy_confirmed IS NOT NULL
-        """)
-        row = cursor.fetchone()
-        total_confirmed = row[0] if row[0] else 0
-        correct = row[1] if row[1] else 0
-        accuracy_rate = correct / total_confirmed \
-            if total_confirmed > 0 else 0.0
-
-        # Get common error patterns (decisions with low accuracy)
-        cursor.execute("""
-            SELECT decision,
-                COUNT(*) as total,
-                AVG(CASE WHEN accuracy_confirmed = 1 THEN 1.0 ELSE 0.0 END)
-                as acc_rate
-            FROM reflection_history
-            WHERE accuracy_confirmed IS NOT NULL
-            GROUP BY decision
-            HAVING acc_rate < 0.8 AND total >= 3
-            ORDER BY total DESC
-            LIMIT 5
-        """)
-        error_rows = cursor.fetchall()
-        common_error_patterns = [f"{row[0]} ({row[2]:.1%} accuracy)"
-                                 for row in error_rows]
-
-        conn.close()
+        with self._read() as cursor:
+            # Get total reflections and the accuracy rate for confirmed
+            # outcomes (in a single pass)
+            cursor.execute(self._REFLECTION_TOTALS_SQL)
+            row = cursor.fetchone()
+            total_reflections = row[0]
+            total_confirmed = row[1]
+            correct = row[2] if row[2] else 0
+            accuracy_rate = correct / total_confirmed \
+                if total_confirmed > 0 else 0.0
+
+            # Get common error patterns (decisions with low accuracy)
+            cursor.execute(self._REFLECTION_ERROR_PATTERNS_SQL)
+            error_rows = cursor.fetchall()
+            common_error_patterns = [f"{row[0]} ({row[2]:.1%} accuracy)"
+                                     for row in error_rows]
 
         return ReflectionMetrics(
             total_reflections=total_reflections,
@@ -247,12 +750,94 @@ class MemoryStore:
         """
         Helper function used to initialise the database schema.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        self._init_table_memory_entries(cursor=cursor)
-        self._init_table_reflection_history(cursor=cursor)
-        conn.commit()
-        conn.close()
+        # (The journal mode cannot be changed within a transaction)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cursor:
+            self._init_table_memory_entries(cursor=cursor)
+            self._init_table_reflection_history(cursor=cursor)
+            self.fts_available = self._init_fts_tables(cursor=cursor)
+        # Baseline for `_check_data_version`
+        with self._write_lock:
+            self._data_version = self._read_data_version()
+
+    def _init_fts_table(
+            self,
+            cursor: sqlite3.Cursor,
+            table: str,
+            column: str):
+        """
+        Helper function used to initialise a trigram full-text index over a
+        text column of a table, kept in sync with it by triggers (and
+        populated from it when first created).
+
+        Args:
+            cursor: Cursor to use
+            table: Name of the indexed table (with an `id` primary key)
+            column: Name of the indexed column
+        """
+        fts_table = f"{table}_fts"
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?",
+                       (fts_table,))
+        is_new = cursor.fetchone() is None
+
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                {column}, content='{table}', content_rowid='id',
+                tokenize='trigram')
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_insert
+            AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts_table}(rowid, {column})
+                VALUES (new.id, new.{column});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_delete
+            AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column})
+                VALUES ('delete', old.id, old.{column});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_update
+            AFTER UPDATE OF {column} ON {table} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column})
+                VALUES ('delete', old.id, old.{column});
+                INSERT INTO {fts_table}(rowid, {column})
+                VALUES (new.id, new.{column});
+            END
+        """)
+
+        if is_new:
+            cursor.execute(f"""
+                INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')
+            """)
+
+    def _init_fts_tables(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Helper function used to initialise the full-text indexes used for
+        substring searches (a leading-wildcard LIKE cannot use a B-tree
+        index, so would otherwise scan the whole table).
+
+        Args:
+            cursor: Cursor to use
+
+        Returns:
+            True if the indexes are available, False if this SQLite build
+            does not support FTS5 with the trigram tokenizer
+        """
+        try:
+            self._init_fts_table(cursor=cursor,
+                                 table="memory_entries",
+                                 column="path_pattern")
+            self._init_fts_table(cursor=cursor,
+                                 table="reflection_history",
+                                 column="path")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+            return False
+        return True
 
     def _init_table_memory_entries(self, cursor: sqlite3.Cursor):
         """
@@ -274,12 +859,35 @@ class MemoryStore:
             )
         """)
 
-        # Create index on path_pattern for faster lookups
+        # Databases created before patterns were unique may have duplicate
+        # rows for a pattern, of which only the first was ever updated, so
+        # keep that one before replacing the (non-unique) index
+        cursor.execute("""
+            SELECT 1 FROM sqlite_master
+            WHERE type = 'index' AND name = 'idx_path_pattern'
+        """)
+        if cursor.fetchone():
+            cursor.execute("""
+                DELETE FROM memory_entries
+                WHERE id NOT IN (
+                    SELECT MIN(id) FROM memory_entries GROUP BY path_pattern)
+            """)
+            cursor.execute("DROP INDEX idx_path_pattern")
+
+        # Create unique index on path_pattern for faster lookups (and so
+        # that saving an entry can be done with an upsert)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_path_pattern
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_path_pattern_unique
             ON memory_entries(path_pattern)
         """)
 
+        # Create index on updated_at, so getting the most recent entries
+        # reads them in order (rather than sorting the whole table)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memory_updated_at
+            ON memory_entries(updated_at DESC)
+        """)
+
     def _init_table_reflection_history(self, cursor: sqlite3.Cursor):
         """
         Helper function used to initialise the `reflection_history` table
@@ -316,10 +924,123 @@ class MemoryStore:
             ON reflection_history(timestamp)
         """)
 
+        # Create covering index for the reflection metrics (which only need
+        # these columns)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_reflection_decision_acc
+            ON reflection_history(decision, accuracy_confirmed)
+        """)
+
+    def iter_all(self, limit: int = 100) -> Iterator[MemoryEntry]:
+        """
+        Helper function used to iterate over the memory entries (most
+        recently updated first), fetching the rows in batches rather than
+        all at once.
+
+        Args:
+            limit: Maximum number of entries
+
+        Yields:
+            MemoryEntry objects
+        """
+        with self._read() as cursor:
+            cursor.execute(self._GET_ALL_SQL, (limit,))
+            while rows := cursor.fetchmany():
+                for row in rows:
+                    yield self._row_to_entry(row)
+
+    def _optimize(self):
+        """
+        Helper function used to run `PRAGMA optimize` on the read-write
+        connection (which re-analyses the tables whose statistics are out of
+        date), and have the pooled readers reopened so that they use the
+        updated statistics. Called with the write lock held.
+        """
+        self._writer.execute("PRAGMA optimize")
+        self._commits_since_optimize = 0
+        self._readers_generation += 1
+
+    @staticmethod
+    def _pack_context(context: Dict[str, Any]) -> Any:
+        """
+        Helper function used to encode a reflection outcome context for
+        storage, as a msgpack BLOB if msgpack is installed (otherwise as
+        JSON text).
+
+        Args:
+            context: The context
+
+        Returns:
+            The encoded context
+        """
+        if msgpack_available:
+            return msgpack.packb(context, use_bin_type=True)
+        return json.dumps(context)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_timestamp(value: str) -> datetime:
+        """
+        Helper function used to parse a stored (ISO 8601) timestamp,
+        memoised since rows saved together share their timestamps.
+
+        Args:
+            value: The stored timestamp
+
+        Returns:
+            datetime object
+        """
+        return datetime.fromisoformat(value)
+
+    @staticmethod
+    def _prefix_range(prefix: str) -> Tuple[str, str]:
+        """
+        Helper function used to get the (inclusive, exclusive) bounds of the
+        strings starting with a (non-empty) prefix, in BINARY collation
+        order.
+
+        Args:
+            prefix: The prefix
+
+        Returns:
+            Tuple of the lower and upper bounds
+        """
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    def _read_data_version(self) -> int:
+        """
+        Helper function used to read `PRAGMA data_version` on the read-write
+        connection (which changes when other connections commit). Called
+        with the write lock held.
+
+        Returns:
+            The data version
+        """
+        return self._writer.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Helper function used to get a cursor on a pooled read-only
+        connection.
+
+        Yields:
+            sqlite3.Cursor
+        """
+        with self._borrow_reader() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = self.FETCH_BATCH_SIZE
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
     def _row_to_entry(self, row) -> MemoryEntry:
         """
         Helper function used to convert a database row into an instance of
-        `MemoryEntry`.
+        `MemoryEntry`. The values are already valid (as they were validated
+        before being saved), so the model is constructed without validating
+        them again.
 
         Args:
             row: Database row tuple
@@ -329,16 +1050,41 @@ class MemoryStore:
         """
         r_dir_type = row["directory_type"]
         r_file_type = row["file_type"]
-        return MemoryEntry(
+        return MemoryEntry.model_construct(
             path_pattern=row["path_pattern"],
-            file_type=FileType(r_file_type) if r_file_type else None,
-            directory_type=DirectoryType(r_dir_type) if r_dir_type else None,
-            user_decision=ApprovalStatus(row["user_decision"]),
-            confidence=DeletionConfidence(row["confidence"]),
+            file_type=self._FILE_TYPES[r_file_type] if r_file_type else None,
+            directory_type=self._DIRECTORY_TYPES[r_dir_type]
+            if r_dir_type else None,
+            user_decision=self._APPROVAL_STATUSES[row["user_decision"]],
+            confidence=self._CONFIDENCES[row["confidence"]],
             approval_count=row["approval_count"],
             rejection_count=row["rejection_count"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
+            created_at=self._parse_timestamp(row["created_at"]),
+            updated_at=self._parse_timestamp(row["updated_at"])
+        )
+
+    def _row_to_reflection_outcome(self, row) -> ReflectionOutcome:
+        """
+        Helper function used to convert a database row into an instance of
+        `ReflectionOutcome` (without validation, as for `_row_to_entry`).
+
+        Args:
+            row: Database row tuple
+
+        Returns:
+            ReflectionOutcome object
+        """
+        accuracy_confirmed = row["accuracy_confirmed"]
+        return ReflectionOutcome.model_construct(
+            path=Path(row["path"]),
+            decision=row["decision"],
+            reasoning=row["reasoning"],
+            accuracy_confirmed=None if accuracy_confirmed is None
+            else bool(accuracy_confirmed),
+            confidence_before=self._CONFIDENCES[row["confidence_before"]],
+            confidence_after=self._CONFIDENCES[row["confidence_after"]],
+            context=self._unpack_context(row["context"]),
+            timestamp=self._parse_timestamp(row["timestamp"])
         )
 
     def save(self, entry: MemoryEntry):
@@ -348,78 +1094,28 @@ class MemoryStore:
         Args:
             entry: MemoryEntry to save
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._transaction() as cursor:
+            cursor.execute(self._UPSERT_ENTRY_SQL, self._entry_to_row(entry))
+        self._clear_lookup_cache()
 
-        # Check if pattern exists
-        cursor.execute("""
-            SELECT
-                id,
-                approval_count,
-                rejection_count
-            FROM
-                memory_entries
-            WHERE
-                path_pattern = ?
-        """, (entry.path_pattern,))
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing entry
-            entry_id, approval_count, rejection_count = existing
-
-            # Update counts based on decision
-            if entry.user_decision == ApprovalStatus.APPROVED:
-                approval_count += 1
-            elif entry.user_decision == ApprovalStatus.REJECTED:
-                rejection_count += 1
+    def save_many(self, entries: List[MemoryEntry]):
+        """
+        Helper function used to save or update several memory entries
+        in a single transaction.
 
-            cursor.execute("""
-                UPDATE memory_entries
-                SET
-                    user_decision = ?,
-                    confidence = ?,
-                    approval_count = ?,
-                    rejection_count = ?,
-                    updated_at = ?
-                WHERE
-                    id = ?
-            """, (
-                entry.user_decision.value,
-                entry.confidence.value,
-                approval_count,
-                rejection_count,
-                datetime.now().isoformat(),
-                entry_id
-            ))
-        else:
-            # Insert new entry
-            cursor.execute("""
-                INSERT INTO memory_entries (
-                    path_pattern,
-                    file_type,
-                    directory_type,
-                    user_decision,
-                    confidence,
-                    approval_count,
-                    rejection_count,
-                    created_at,
-                    updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.path_pattern,
-                entry.file_type.value if entry.file_type else None,
-                entry.directory_type.value if entry.directory_type else None,
-                entry.user_decision.value,
-                entry.confidence.value,
-                1 if entry.user_decision == ApprovalStatus.APPROVED else 0,
-                1 if entry.user_decision == ApprovalStatus.REJECTED else 0,
-                entry.created_at.isoformat(),
-                entry.updated_at.isoformat()
-            ))
+        Entries are applied in order, exactly as repeated `save` calls would,
+        so several decisions for the same pattern accumulate their counts.
 
-        conn.commit()
-        conn.close()
+        Args:
+            entries: MemoryEntry objects to save
+        """
+        if not entries:
+            return
+
+        with self._transaction() as cursor:
+            cursor.executemany(self._UPSERT_ENTRY_SQL,
+                               [self._entry_to_row(e) for e in entries])
+        self._clear_lookup_cache()
 
     def save_reflection_outcome(self, outcome: ReflectionOutcome):
         """
@@ -428,34 +1124,33 @@ class MemoryStore:
         Args:
             outcome: ReflectionOutcome to save
         """
+        self.save_reflection_outcomes([outcome])
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def save_reflection_outcomes(self, outcomes: List[ReflectionOutcome]):
+        """
+        Helper function used to save several reflection outcomes to the
+        database in a single transaction.
 
-        cursor.execute("""
-            INSERT INTO reflection_history (
-                path,
-                decision,
-                reasoning,
-                accuracy_confirmed,
-                confidence_before,
-                confidence_after,
-                context,
-                timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            str(outcome.path),
-            outcome.decision,
-            outcome.reasoning,
-            outcome.accuracy_confirmed,
-            outcome.confidence_before.value,
-            outcome.confidence_after.value,
-            json.dumps(outcome.context),
-            outcome.timestamp.isoformat()
-        ))
-
-        conn.commit()
-        conn.close()
+        Args:
+            outcomes: ReflectionOutcome objects to save
+        """
+        if not outcomes:
+            return
+
+        with self._transaction() as cursor:
+            cursor.executemany(self._INSERT_REFLECTION_SQL, [
+                (
+                    str(outcome.path),
+                    outcome.decision,
+                    outcome.reasoning,
+                    outcome.accuracy_confirmed,
+                    outcome.confidence_before.value,
+                    outcome.confidence_after.value,
+                    self._pack_context(outcome.context),
+                    outcome.timestamp.isoformat()
+                )
+                for outcome in outcomes
+            ])
 
     def search(self, query: str, limit: int = 10) -> List[MemoryEntry]:
         """
@@ -468,31 +1163,90 @@ class MemoryStore:
         Returns:
             List of matching MemoryEntry objects
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT
-                path_pattern,
-                file_type,
-                directory_type,
-                user_decision,
-                confidence,
-                approval_count,
-                rejection_count,
-                created_at,
-                updated_at
-            FROM
-                memory_entries
-            WHERE
-                path_pattern LIKE ?
-                LIMIT ?
-        """, (f"%{query}%", limit))
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read() as cursor:
+            sql = self._SEARCH_FTS_SQL if self.fts_available \
+                else self._SEARCH_SQL
+            cursor.execute(sql, (f"%{query}%", limit))
+            rows = cursor.fetchall()
 
         return [self._row_to_entry(row) for row in rows]
 
+    def search_prefix(
+            self,
+            prefix: str,
+            limit: int = 10) -> List[MemoryEntry]:
+        """
+        Helper function used to search for entries whose path pattern starts
+        with a prefix (e.g. a directory). Unlike `search`, this uses the
+        index on the path pattern, and is case-sensitive.
+
+        Args:
+            prefix: Prefix to search for
+            limit: Maximum number of results
+
+        Returns:
+            List of matching MemoryEntry objects
+        """
+        if not prefix:
+            return self.search(prefix, limit=limit)
+
+        with self._read() as cursor:
+            cursor.execute(self._SEARCH_PREFIX_SQL,
+                           (*self._prefix_range(prefix), limit))
+            rows = cursor.fetchall()
+
+        return [self._row_to_entry(row) for row in rows]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Helper function used to get a cursor on the read-write connection,
+        which is used by one thread at a time. The transaction is begun with
+        BEGIN IMMEDIATE, so the write lock is taken (waiting up to the busy
+        timeout) before any reads, rather than failing with SQLITE_BUSY when
+        a read is upgraded. The changes are committed when the block exits
+        (or rolled back if it raises).
+
+        Yields:
+            sqlite3.Cursor
+        """
+        with self._write_lock:
+            cursor = self._writer.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+            self._commits_since_optimize += 1
+            if self._commits_since_optimize >= self.OPTIMIZE_EVERY_COMMITS:
+                self._optimize()
+
+    @staticmethod
+    def _unpack_context(value: Any) -> Dict[str, Any]:
+        """
+        Helper function used to decode a stored reflection outcome context,
+        which is a msgpack BLOB or JSON text (as written before msgpack was
+        used, or without it installed).
+
+        Args:
+            value: The stored context
+
+        Returns:
+            The context
+        """
+        if not value:
+            return {}
+        if isinstance(value, bytes):
+            if not msgpack_available:
+                raise MemoryRetrievalError(
+                    "msgpack is needed to read the stored reflection history")
+            return msgpack.unpackb(value, raw=False)
+        return json.loads(value)
+
     def update_reflection_accuracy(self, path: str, confirmed: bool):
         """
         Helper function used to update the accuracy confirmation for reflection
@@ -502,14 +1256,6 @@ class MemoryStore:
             path: Path to update
             confirmed: Whether the reflection was accurate
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE reflection_history
-            SET accuracy_confirmed = ?
-            WHERE path = ?
-        """, (1 if confirmed else 0, path))
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute(self._UPDATE_REFLECTION_ACCURACY_SQL,
+                           (1 if confirmed else 0, path))
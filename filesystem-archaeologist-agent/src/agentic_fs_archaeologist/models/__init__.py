@@ -25,6 +25,7 @@ from agentic_fs_archaeologist.models.base import (
 from agentic_fs_archaeologist.models.filesystem import (
     FileMetadata,
     DirectoryInfo,
+    ages_days,
 )
 
 # Classification models
@@ -80,6 +81,7 @@ __all__ = [
     # Filesystem
     "FileMetadata",
     "DirectoryInfo",
+    "ages_days",
     # Classification
     "Classification",
     "ReflectionCritique",
@@ -7,7 +7,6 @@ from typing import (
 from pydantic import (
     BaseModel,
     Field,
-    field_validator,
 )
 
 from agentic_fs_archaeologist.models.base import (
@@ -34,14 +33,6 @@ class Classification(BaseModel):
     dependencies: List[str] = Field(default_factory=list)
     risks: List[str] = Field(default_factory=list)
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
-
     @property
     def savings_gb(self) -> float:
         """
@@ -61,11 +52,3 @@ class ReflectionCritique(BaseModel):
     additional_risks: List[str] = Field(default_factory=list)
     should_review: bool = False
     critique_reasoning: str
-
-    @field_validator("classification_path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
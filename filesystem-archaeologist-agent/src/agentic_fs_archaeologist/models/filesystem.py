@@ -6,8 +6,8 @@ from typing import (
 )
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
-    field_validator,
 )
 
 from agentic_fs_archaeologist.models.base import DirectoryType
@@ -16,8 +16,10 @@ from agentic_fs_archaeologist.models.base import DirectoryType
 class FileMetadata(BaseModel):
     """
     Pydantic data model used to represent/contain the metadata about a file
-    or directory.
+    or directory. Immutable, as it records the file as it was when scanned.
     """
+    model_config = ConfigDict(frozen=True)
+
     path: Path
     size_bytes: int
     created_at: datetime
@@ -33,15 +35,20 @@ class FileMetadata(BaseModel):
         """
         Helper function used to get the age in days since last modification.
         """
-        return (datetime.now() - self.modified_at).days
+        return self.age_days_at(datetime.now())
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
+    def age_days_at(self, now: datetime) -> int:
         """
-        Helper function used to convert string paths to Path objects.
+        Helper function used to get the age in days since last modification,
+        as of a given time (see `ages_days`).
+
+        Args:
+            now: Time to get the age as of
+
+        Returns:
+            Age in days
         """
-        return Path(v) if isinstance(v, str) else v
+        return (now - self.modified_at).days
 
     @property
     def size_gb(self) -> float:
@@ -58,6 +65,22 @@ class FileMetadata(BaseModel):
         return self.size_bytes / (1024 * 1024)
 
 
+def ages_days(files: List[FileMetadata]) -> List[int]:
+    """
+    Helper function used to get the ages in days since last modification of
+    several files, as of the same time (getting the current time once,
+    rather than once per file).
+
+    Args:
+        files: The files
+
+    Returns:
+        Ages in days, in the order of the files
+    """
+    now = datetime.now()
+    return [(now - f.modified_at).days for f in files]
+
+
 class DirectoryInfo(BaseModel):
     """
     Pydantic data model used to represent/contain the information
@@ -70,14 +93,6 @@ class DirectoryInfo(BaseModel):
     directory_type: Optional[DirectoryType] = None
     largest_files: List[FileMetadata] = Field(default_factory=list)
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
-
     @property
     def size_gb(self) -> float:
         """
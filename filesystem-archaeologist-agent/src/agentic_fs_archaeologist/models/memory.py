@@ -3,6 +3,7 @@ from typing import Optional
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
 )
 
@@ -17,7 +18,11 @@ from agentic_fs_archaeologist.models.base import (
 class MemoryEntry(BaseModel):
     """
     Pydantic data model used for an entry in the agent's memory system.
+    Immutable, so that entries can be shared by the memory store's lookup
+    cache (changes are made by saving a new entry).
     """
+    model_config = ConfigDict(frozen=True)
+
     path_pattern: str
     file_type: Optional[FileType] = None
     directory_type: Optional[DirectoryType] = None
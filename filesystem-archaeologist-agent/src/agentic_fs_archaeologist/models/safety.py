@@ -3,15 +3,18 @@ from typing import List
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
-    field_validator,
 )
 
 
 class SafetyCheck(BaseModel):
     """
     Pydantic data model used for the results of safety checks.
+    Immutable, so that identical results can be shared.
     """
+    model_config = ConfigDict(frozen=True)
+
     check_name: str
     passed: bool
     reason: str
@@ -27,11 +30,3 @@ class ValidationResult(BaseModel):
     checks: List[SafetyCheck]
     blocking_issues: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
-
-    @field_validator('path', mode='before')
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
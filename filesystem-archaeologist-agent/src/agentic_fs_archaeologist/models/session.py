@@ -8,7 +8,6 @@ from typing import (
 from pydantic import (
     BaseModel,
     Field,
-    field_validator,
 )
 
 from agentic_fs_archaeologist.models.base import ApprovalStatus
@@ -25,14 +24,6 @@ class UserDecision(BaseModel):
     user_feedback: Optional[str] = None
     decided_at: datetime = Field(default_factory=datetime.now)
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
-
 
 class CleanupSession(BaseModel):
     """
@@ -45,14 +36,6 @@ class CleanupSession(BaseModel):
     decisions: List[UserDecision] = Field(default_factory=list)
     total_space_freed_bytes: int = 0
 
-    @field_validator("target_path", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """
-        Helper function used to convert string paths to Path objects.
-        """
-        return Path(v) if isinstance(v, str) else v
-
     @property
     def approval_rate(self) -> float:
         """
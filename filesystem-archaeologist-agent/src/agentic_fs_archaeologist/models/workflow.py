@@ -6,6 +6,7 @@ from typing import (
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
 )
 
@@ -15,7 +16,10 @@ from agentic_fs_archaeologist.models.agent import AgentResult
 class PlanStep(BaseModel):
     """
     Pydantic data model used for a single step in an execution plan.
+    The schema is built when first used (only plan-execute agents use it).
     """
+    model_config = ConfigDict(defer_build=True)
+
     step_id: str
     agent_name: str
     description: str
@@ -27,7 +31,10 @@ class PlanStep(BaseModel):
 class ExecutionPlan(BaseModel):
     """
     Pydantic data model used for a plan for executing the cleanup workflow.
+    The schema is built when first used, as for `PlanStep`.
     """
+    model_config = ConfigDict(defer_build=True)
+
     steps: List[PlanStep]
     created_at: datetime = Field(default_factory=datetime.now)
     current_step_index: int = 0
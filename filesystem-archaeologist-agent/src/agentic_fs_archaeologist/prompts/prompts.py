@@ -9,24 +9,29 @@ from typing import (
 )
 
 from agentic_fs_archaeologist.app_logger import get_logger
-from agentic_fs_archaeologist.utils.file_utils import validate_file_path
 
 
 logger = get_logger(__name__)
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=4)
 def load_prompts(
         prompt_json_file_path: Optional[Path] = None) -> Dict[str, Any]:
-    if prompt_json_file_path:
-        if validate_file_path(file_path=prompt_json_file_path) is False:
-            error_message = "Unable to read file containing prompts " +\
-                            "Invalid file path passed"
-            raise FileNotFoundError(error_message)
-        p = Path(prompt_json_file_path)
-    else:
-        p = Path(__file__).parent / "prompts.json"
-    if not p.exists():
-        raise FileNotFoundError("prompts.json not found in current directory")
+    p = Path(prompt_json_file_path) if prompt_json_file_path \
+        else Path(__file__).parent / "prompts.json"
     logger.debug(f"Loading prompts from {p}...")
-    return json.loads(p.read_text(encoding="utf-8"))
+    # (Reading raises if the file does not exist, so there is no need to
+    # check first; the bytes are decoded by `json.loads`)
+    try:
+        data = p.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompts file not found: {p}") from None
+    return json.loads(data)
+
+
+def reload_prompts():
+    """
+    Clear the cached prompts, so that they are re-read on the next
+    `load_prompts` call (mainly for testing).
+    """
+    load_prompts.cache_clear()
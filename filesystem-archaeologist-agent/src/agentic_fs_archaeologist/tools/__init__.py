@@ -1,5 +1,21 @@
 from agentic_fs_archaeologist.tools.filesystem import FileSystemTools
+from agentic_fs_archaeologist.tools.fs_executor import (
+    SharedFSContext,
+    fs_executor_var,
+    run_in_fs_executor,
+    run_sync_batched,
+)
+from agentic_fs_archaeologist.tools.stat_cache import (
+    StatCache,
+    get_stat_cache,
+)
 
 __all__ = [
-    "FileSystemTools"
+    "FileSystemTools",
+    "SharedFSContext",
+    "StatCache",
+    "fs_executor_var",
+    "get_stat_cache",
+    "run_in_fs_executor",
+    "run_sync_batched",
 ]
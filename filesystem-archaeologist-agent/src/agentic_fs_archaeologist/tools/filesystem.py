@@ -7,7 +7,15 @@ import string
 import tempfile
 import time
 
-from collections import defaultdict
+from collections import (
+    defaultdict,
+    deque,
+)
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+)
+from contextlib import nullcontext
 from datetime import (
     datetime,
     timedelta,
@@ -22,6 +30,7 @@ from typing import (
 
 from agentic_fs_archaeologist.app_logger import get_logger
 from agentic_fs_archaeologist.config import get_settings
+from agentic_fs_archaeologist.tools.stat_cache import get_stat_cache
 
 
 logger = get_logger(__name__)
@@ -124,6 +133,17 @@ class FileSystemTools:
             logger.error(f"Error analyzing directory {path}: {str(e)}")
             return {"error": str(e)}
 
+    @staticmethod
+    def _cache_entry_stat(entry: os.DirEntry) -> None:
+        """
+        Helper function used to add the stat result of a directory entry to
+        the shared stat cache (see `StatCache`).
+        """
+        try:
+            get_stat_cache().put(entry.path, entry.stat())
+        except OSError:
+            pass
+
     @staticmethod
     def _calculate_growth_changes(
             latest_sizes: Dict[str, int],
@@ -171,13 +191,14 @@ class FileSystemTools:
             snapshots_info = FileSystemTools._get_snapshot_files(csv_file)
             if len(snapshots_info) < 2:
                 return {"error": "Need at least 2 snapshots for comparison"}
-            logger.debug(f"Found {len(snapshots_info)} snapshots for analysis")
+            logger.debug("Found %d snapshots for analysis",
+                         len(snapshots_info))
 
             # Get the two most recent snapshots for comparison
             sorted_snapshots = sorted(snapshots_info.keys(), reverse=True)
             latest_ts = sorted_snapshots[0]
             prev_ts = sorted_snapshots[1]
-            logger.debug(f"Comparing snapshots: {prev_ts} -> {latest_ts}")
+            logger.debug("Comparing snapshots: %s -> %s", prev_ts, latest_ts)
 
             # Load directory sizes for comparison (one snapshot at a time)
             latest_dir_sizes = FileSystemTools._load_directory_sizes(
@@ -224,7 +245,7 @@ class FileSystemTools:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d")
         try:
-            logger.debug(f"Creating snapshot for CSV: {csv_file}")
+            logger.debug("Creating snapshot for CSV: %s", csv_file)
             csv_path = Path(csv_file)
             backup_name = f"{csv_path.stem}_{timestamp}{csv_path.suffix}"
             backup_path = csv_path.parent / backup_name
@@ -327,26 +348,24 @@ class FileSystemTools:
             Total size in bytes
         """
         total = 0
-        visited: set[Path] = set()
-        try:
-            for item in path.rglob("*"):
-                # Skip symlinks to avoid infinite loops
-                if item.is_symlink():
-                    continue
-
-                # Skip if already visited (for hardlinks)
-                try:
-                    stat_info = item.stat()
-                    if item in visited:
-                        continue
-                    visited.add(item)
-
-                    if item.is_file():
-                        total += stat_info.st_size
-                except (PermissionError, FileNotFoundError, OSError):
-                    continue
-        except (PermissionError, OSError):
-            pass
+        pending = deque([path])
+        while pending:
+            try:
+                with os.scandir(pending.popleft()) as entries:
+                    for entry in entries:
+                        try:
+                            # Skip symlinks to avoid infinite loops
+                            if entry.is_symlink():
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(
+                                    follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
         return total
 
     @staticmethod
@@ -473,6 +492,20 @@ class FileSystemTools:
         except Exception as e:
             return {"error": str(e)}
 
+    @staticmethod
+    def _get_entry_size(entry: os.DirEntry) -> Optional[int]:
+        """
+        Helper function used to get the size of a directory entry (the file
+        size, or the total size of a directory). Returns None if the entry
+        cannot be read.
+        """
+        try:
+            if entry.is_file():
+                return entry.stat().st_size
+            return FileSystemTools._get_dir_size(Path(entry.path))
+        except OSError:
+            return None
+
     @staticmethod
     def _get_snapshot_files(
             csv_file: str,
@@ -495,7 +528,7 @@ class FileSystemTools:
             timestamp = FileSystemTools._extract_timestamp_from_filename(
                 filepath=snapshot_file)
             if timestamp:
-                logger.debug(f"Found snapshot: {snapshot_file}")
+                logger.debug("Found snapshot: %s", snapshot_file)
                 snapshots[timestamp] = {
                     "file": snapshot_file,
                     "timestamp": timestamp
@@ -523,6 +556,18 @@ class FileSystemTools:
             ))
         return False
 
+    @staticmethod
+    def _list_directory(path: str) -> List[os.DirEntry]:
+        """
+        Helper function used to list the entries of a directory. Returns an
+        empty list if the directory cannot be read.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return list(entries)
+        except OSError:
+            return []
+
     @staticmethod
     def _load_directory_sizes(csv_filepath: Path) -> Dict[str, int]:
         """
@@ -622,7 +667,8 @@ class FileSystemTools:
     def scan_directory(
             path: str,
             depth: int = 1,
-            min_size_mb: float = 100) -> Dict:
+            min_size_mb: float = 100,
+            executor: Optional[Executor] = None) -> Dict:
         """
         Helper function used to scan a directory and return contents summary.
 
@@ -630,6 +676,8 @@ class FileSystemTools:
             path: Directory path to scan
             depth: How many levels deep to scan
             min_size_mb: Minimum size in MB to include
+            executor: Executor to list and size entries in (a thread pool
+                is created for this scan if not given)
 
         Returns:
             Dictionary with directory contents summary
@@ -648,44 +696,66 @@ class FileSystemTools:
 
             items = []
             total_size = 0
-
-            def scan_recursive(current_path: Path, current_depth: int):
-                nonlocal total_size
-                try:
-                    for item in current_path.iterdir():
+            settings = get_settings()
+            max_entries = settings.scan_max_entries
+            n_entries = 0
+
+            # Breadth-first walk, one level at a time. Each level's
+            # directories are listed (using os.scandir) and their entries
+            # sized in parallel, as sizing directories dominates the cost
+            level = [str(target)]
+            current_depth = 0
+            pool = nullcontext(executor) if executor is not None else \
+                ThreadPoolExecutor(max_workers=settings.scan_parallelism)
+            with pool as executor:
+                while level and n_entries < max_entries:
+                    entries = []
+                    for listing in executor.map(
+                            FileSystemTools._list_directory, level):
                         # Skip hidden files at root level
-                        if item.name.startswith(".") and current_depth == 0:
+                        entries.extend(
+                            entry for entry in listing
+                            if current_depth > 0 or
+                            not entry.name.startswith("."))
+                    if n_entries + len(entries) > max_entries:
+                        logger.warning("Scan of %s stopped after %d entries",
+                                       target, max_entries)
+                        entries = entries[:max_entries - n_entries]
+                    n_entries += len(entries)
+
+                    next_level = []
+                    sizes = executor.map(
+                        FileSystemTools._get_entry_size, entries)
+                    for entry, size in zip(entries, sizes):
+                        if size is None:
                             continue
-
                         try:
-                            if item.is_file():
-                                size = item.stat().st_size
-                            else:
-                                size = FileSystemTools._get_dir_size(item)
-
-                            total_size += size
-                            size_mb = size / (1024 * 1024)
-
-                            # Only include items above minimum size
-                            if size_mb >= min_size_mb:
-                                items.append({
-                                    "path": str(item),
-                                    "name": item.name,
-                                    "is_directory": item.is_dir(),
-                                    "size_bytes": size,
-                                    "size_mb": size_mb,
-                                    "size_gb": size / (1024 * 1024 * 1024),
-                                })
-
-                            # Recurse if directory and depth allows
-                            if item.is_dir() and current_depth < depth:
-                                scan_recursive(item, current_depth + 1)
-                        except (PermissionError, OSError):
+                            is_dir = entry.is_dir()
+                        except OSError:
                             continue
-                except (PermissionError, OSError):
-                    pass
 
-            scan_recursive(target, 0)
+                        total_size += size
+                        size_mb = size / (1024 * 1024)
+
+                        # Only include items above minimum size
+                        if size_mb >= min_size_mb:
+                            # Share the stat result with later checks
+                            FileSystemTools._cache_entry_stat(entry)
+                            items.append({
+                                "path": entry.path,
+                                "name": entry.name,
+                                "is_directory": is_dir,
+                                "size_bytes": size,
+                                "size_mb": size_mb,
+                                "size_gb": size / (1024 * 1024 * 1024),
+                            })
+
+                        # Scan directory in the next level if depth allows
+                        if is_dir and current_depth < depth:
+                            next_level.append(entry.path)
+
+                    level = next_level
+                    current_depth += 1
 
             # Sort by size
             items.sort(key=lambda x: x["size_bytes"], reverse=True)
@@ -846,7 +916,8 @@ class FileSystemTools:
                     if csv_path_normalized in normalized_input_paths:
                         row["last_visited"] = current_time
                         updated_count += 1
-                        logger.debug(f"Updated last_visited for {row['path']}")
+                        logger.debug("Updated last_visited for %s",
+                                     row["path"])
                     writer.writerow(row)
 
         # Only replace if updates made
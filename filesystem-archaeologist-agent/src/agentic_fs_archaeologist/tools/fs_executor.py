@@ -0,0 +1,81 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import (
+    ContextVar,
+    Token,
+)
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+)
+
+from agentic_fs_archaeologist.app_logger import get_logger
+from agentic_fs_archaeologist.config import get_settings
+
+
+logger = get_logger(__name__)
+
+# Thread pool shared by the agents for blocking filesystem calls (see
+# `SharedFSContext`); unset outside of one
+fs_executor_var: ContextVar[ThreadPoolExecutor] = ContextVar("fs_executor")
+
+
+class SharedFSContext:
+    """
+    Used to create one thread pool for blocking filesystem calls, and share
+    it with the agents (via `fs_executor_var`) for the duration of a run.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or get_settings().scan_parallelism
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._token: Optional[Token] = None
+
+    async def __aenter__(self) -> ThreadPoolExecutor:
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="fs")
+        self._token = fs_executor_var.set(self.executor)
+        logger.debug("Created shared filesystem executor with %d workers",
+                     self.max_workers)
+        return self.executor
+
+    async def __aexit__(self, *exc_info) -> None:
+        fs_executor_var.reset(self._token)
+        # Wait for outstanding calls without blocking the event loop
+        await asyncio.to_thread(self.executor.shutdown, wait=True)
+        self.executor = None
+
+
+async def run_sync_batched(
+        iterable: Iterable,
+        batch_size: int = 100) -> AsyncIterator[List]:
+    """
+    Helper function used to consume a blocking iterable (e.g. `os.scandir`)
+    in the shared executor, a batch at a time, so that there is one hop to
+    and from the worker thread per batch rather than per item.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = await run_in_fs_executor(list, islice(iterator, batch_size))
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+
+
+async def run_in_fs_executor(func: Callable, *args, **kwargs) -> Any:
+    """
+    Helper function used to run a blocking filesystem function in the shared
+    executor, or in the event loop's default executor if none is set.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        fs_executor_var.get(None), partial(func, *args, **kwargs))
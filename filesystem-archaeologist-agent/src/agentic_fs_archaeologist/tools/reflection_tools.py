@@ -284,8 +284,15 @@ class ReflectionTools:
         # Uses LIKE pattern matching for flexible path searches
         # e.g., searching "installer" finds
         # "installer.exe", "~/Downloads/installer"
-        outcomes: List[ReflectionOutcome] =\
-            memory_store.get_reflection_history(
+        # (Absolute paths are prefixes of the stored paths, so are searched
+        # for using the index instead)
+        if Path(path_pattern).is_absolute():
+            outcomes: List[ReflectionOutcome] =\
+                memory_store.get_reflection_history_by_prefix(
+                    path_prefix=path_pattern,
+                    limit=10)
+        else:
+            outcomes = memory_store.get_reflection_history(
                 path_pattern=path_pattern,
                 limit=10)
 
@@ -317,7 +324,14 @@ class ReflectionTools:
         try:
             # Use synchronous search via the underlying store
             search_term = criteria.strip("*")  # Remove wildcards
-            similar_entries = memory.store.search(search_term, limit=10)
+            if criteria.startswith(search_term) and \
+                    Path(search_term).is_absolute():
+                # Absolute path (e.g. "/home/user/*"), which is a prefix of
+                # the stored paths, so is searched for using the index
+                similar_entries = memory.store.search_prefix(search_term,
+                                                             limit=10)
+            else:
+                similar_entries = memory.store.search(search_term, limit=10)
 
             return {
                 "search_criteria": criteria,
@@ -344,7 +358,8 @@ class ReflectionTools:
         reasoning: str,
         confidence_before: str,
         confidence_after: str,
-        memory_store: Optional[MemoryStore] = None
+        memory_store: Optional[MemoryStore] = None,
+        pending_outcomes: Optional[List[ReflectionOutcome]] = None
     ) -> Dict:
         """
         Helper function used to record a reflection decision
@@ -357,14 +372,13 @@ class ReflectionTools:
             confidence_before: Original confidence level
             confidence_after: New confidence level after reflection
             memory_store: Optional MemoryStore instance
+            pending_outcomes: Optional list to append the outcome to, for
+                the caller to save in a batch (instead of saving it now)
 
         Returns:
             Acknowledgment of storage
         """
 
-        if memory_store is None:
-            memory_store = MemoryStore()
-
         accuracy_confirmed = None  # To be confirmed later via HITL
         # Note: This is a deferred confirmation
         # and updated later when user actions provide ground truth
@@ -383,7 +397,12 @@ class ReflectionTools:
             timestamp=datetime.now()
         )
 
-        memory_store.save_reflection_outcome(outcome)
+        if pending_outcomes is not None:
+            pending_outcomes.append(outcome)
+        else:
+            if memory_store is None:
+                memory_store = MemoryStore()
+            memory_store.save_reflection_outcome(outcome)
 
         return {
             "stored_decision": decision,
@@ -0,0 +1,99 @@
+import os
+import time
+
+from typing import (
+    Dict,
+    Optional,
+    Union,
+)
+
+from agentic_fs_archaeologist.app_logger import get_logger
+from agentic_fs_archaeologist.config import get_settings
+
+
+logger = get_logger(__name__)
+
+
+class StatCache:
+    """
+    Used to share `os.stat` results between agents, so that a path stat-ed
+    while scanning is not stat-ed again (e.g. when validating it) within
+    the TTL. Only successful stat results are cached.
+    """
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.ttl = ttl if ttl is not None else get_settings().stat_cache_ttl
+        self._entries: Dict[str, Dict] = {}
+
+    def clear(self) -> None:
+        """
+        Helper function used to drop all cached stat results.
+        """
+        self._entries.clear()
+
+    def get(self, path: Union[str, os.PathLike]) -> Optional[os.stat_result]:
+        """
+        Helper function used to get the cached stat result for the path, if
+        there is one which has not expired.
+        """
+        key = os.fspath(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry["timestamp"] >= self.ttl:
+            self._entries.pop(key, None)
+            return None
+        return entry["stat"]
+
+    def invalidate(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Helper function used to drop the cached stat result for the path,
+        e.g. after it has been modified or deleted.
+        """
+        self._entries.pop(os.fspath(path), None)
+
+    def put(
+            self,
+            path: Union[str, os.PathLike],
+            stat_result: os.stat_result) -> None:
+        """
+        Helper function used to cache the stat result for the path.
+        """
+        self._entries[os.fspath(path)] = {
+            "stat": stat_result,
+            "timestamp": time.time(),
+        }
+
+    def stat(self, path: Union[str, os.PathLike]) -> os.stat_result:
+        """
+        Helper function used to stat the path (following symlinks, as
+        `os.stat`), using the cached result if there is one. Raises the same
+        errors as `os.stat`.
+        """
+        stat_result = self.get(path)
+        if stat_result is None:
+            stat_result = os.stat(path)
+            self.put(path, stat_result)
+        return stat_result
+
+
+# Global stat cache instance
+_stat_cache: Optional[StatCache] = None
+
+
+def get_stat_cache() -> StatCache:
+    """
+    Get global stat cache instance.
+    """
+    global _stat_cache
+    if _stat_cache is None:
+        _stat_cache = StatCache()
+    return _stat_cache
+
+
+def reset_stat_cache():
+    """
+    Reset stat cache (mainly for testing).
+    """
+    global _stat_cache
+    _stat_cache = None